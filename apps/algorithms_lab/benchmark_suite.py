@@ -0,0 +1,399 @@
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable
+
+from core.algorithms import (
+    SortedArray,
+    adaptive_sort,
+    binary_search,
+    bottom_up_merge_sort,
+    bubble_sort,
+    exponential_search,
+    fibonacci,
+    fibonacci_fast_doubling,
+    fibonacci_iterative,
+    fibonacci_matrix,
+    fibonacci_recursive,
+    interpolation_search,
+    merge_sort,
+    numeric_sort,
+    parallel_sort,
+    quick_sort,
+)
+
+DEFAULT_SIZES = [10, 100, 1_000, 10_000, 100_000]
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_MIN_SECONDS = 0.001
+DEFAULT_COMPARISON_LIMIT = 100_000
+DEFAULT_LOOKUPS = 1_000
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    run: Callable[..., object]
+    max_size: int | None = None
+    counts_comparisons: bool = True
+
+
+class CountingValue:
+    """Wraps a value and counts every comparison made against it."""
+
+    __slots__ = ("value",)
+    comparisons = 0
+
+    def __init__(self, value) -> None:
+        self.value = value
+
+    def __lt__(self, other: "CountingValue") -> bool:
+        CountingValue.comparisons += 1
+        return self.value < other.value
+
+    def __le__(self, other: "CountingValue") -> bool:
+        CountingValue.comparisons += 1
+        return self.value <= other.value
+
+    def __gt__(self, other: "CountingValue") -> bool:
+        CountingValue.comparisons += 1
+        return self.value > other.value
+
+    def __ge__(self, other: "CountingValue") -> bool:
+        CountingValue.comparisons += 1
+        return self.value >= other.value
+
+    def __eq__(self, other: object) -> bool:
+        CountingValue.comparisons += 1
+        return isinstance(other, CountingValue) and self.value == other.value
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+class CountingSortedArray(SortedArray):
+    """A SortedArray that counts probes, i.e. reads of a position other than the previous one."""
+
+    probes = 0
+    _last_index = None
+
+    def __getitem__(self, index: int) -> object:
+        if index != self._last_index:
+            CountingSortedArray.probes += 1
+            self._last_index = index
+        return self._items[index]
+
+
+SORT_CASES: dict[str, BenchmarkCase] = {
+    "bubble_sort": BenchmarkCase(bubble_sort, max_size=2_000),
+    "merge_sort": BenchmarkCase(merge_sort),
+    "bottom_up_merge_sort": BenchmarkCase(bottom_up_merge_sort),
+    "quick_sort": BenchmarkCase(lambda data: quick_sort(data, 0, len(data) - 1)),
+    "adaptive_sort": BenchmarkCase(adaptive_sort),
+    "numeric_sort": BenchmarkCase(numeric_sort, counts_comparisons=False),
+    "parallel_sort": BenchmarkCase(
+        lambda data: parallel_sort(data, threshold=0), counts_comparisons=False
+    ),
+}
+
+
+SEARCH_CASES: dict[str, Callable[[object, SortedArray], int | None]] = {
+    "binary_search": binary_search,
+    "interpolation_search": interpolation_search,
+    "exponential_search": exponential_search,
+}
+
+
+# Benchmarked on the index n; the inputs are n itself, so there are no distributions.
+FIBONACCI_CASES: dict[str, BenchmarkCase] = {
+    "fibonacci_recursive": BenchmarkCase(
+        fibonacci_recursive, max_size=500, counts_comparisons=False
+    ),
+    "fibonacci_iterative": BenchmarkCase(
+        fibonacci_iterative, max_size=200_000, counts_comparisons=False
+    ),
+    "fibonacci_matrix": BenchmarkCase(fibonacci_matrix, counts_comparisons=False),
+    "fibonacci_fast_doubling": BenchmarkCase(fibonacci_fast_doubling, counts_comparisons=False),
+    "fibonacci": BenchmarkCase(fibonacci, counts_comparisons=False),
+}
+
+
+def _random(size: int, rng: random.Random) -> list[int]:
+    return [rng.randrange(2**31) for _ in range(size)]
+
+
+def _sorted(size: int, rng: random.Random) -> list[int]:
+    return list(range(size))
+
+
+def _reversed(size: int, rng: random.Random) -> list[int]:
+    return list(range(size, 0, -1))
+
+
+def _organ_pipe(size: int, rng: random.Random) -> list[int]:
+    half = size // 2
+    return list(range(half)) + list(range(size - half, 0, -1))
+
+
+def _few_unique(size: int, rng: random.Random) -> list[int]:
+    return [rng.randrange(10) for _ in range(size)]
+
+
+def _nearly_sorted(size: int, rng: random.Random) -> list[int]:
+    data = list(range(size))
+    if size > 1:
+        for _ in range(max(1, size // 100)):
+            i, j = rng.randrange(size), rng.randrange(size)
+            data[i], data[j] = data[j], data[i]
+    return data
+
+
+DISTRIBUTIONS: dict[str, Callable[[int, random.Random], list[int]]] = {
+    "random": _random,
+    "sorted": _sorted,
+    "reversed": _reversed,
+    "organ_pipe": _organ_pipe,
+    "few_unique": _few_unique,
+    "nearly_sorted": _nearly_sorted,
+}
+
+
+def _uniform_table(size: int, rng: random.Random) -> list[int]:
+    return sorted(rng.randrange(size * 100) for _ in range(size))
+
+
+def _skewed_table(size: int, rng: random.Random) -> list[int]:
+    return sorted(int(rng.expovariate(1 / size) ** 2) for _ in range(size))
+
+
+SEARCH_DISTRIBUTIONS: dict[str, Callable[[int, random.Random], list[int]]] = {
+    "uniform": _uniform_table,
+    "skewed": _skewed_table,
+}
+
+
+def measure(case: BenchmarkCase, data: list, repeat: int, comparison_limit: int) -> dict:
+    """Return wall time (best of repeat), peak traced memory and comparison count for one case."""
+    best = float("inf")
+    for _ in range(repeat):
+        sample = data.copy()
+        start = time.perf_counter()
+        case.run(sample)
+        best = min(best, time.perf_counter() - start)
+
+    sample = data.copy()
+    tracemalloc.start()
+    try:
+        case.run(sample)
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    comparisons = None
+    if case.counts_comparisons and len(data) <= comparison_limit:
+        wrapped = [CountingValue(value) for value in data]
+        CountingValue.comparisons = 0
+        case.run(wrapped)
+        comparisons = CountingValue.comparisons
+
+    return {"seconds": best, "peak_bytes": peak_bytes, "comparisons": comparisons}
+
+
+def run_benchmarks(
+    cases: dict[str, BenchmarkCase],
+    distributions: list[str],
+    sizes: list[int],
+    repeat: int = 3,
+    seed: int = 0,
+    comparison_limit: int = DEFAULT_COMPARISON_LIMIT,
+) -> list[dict]:
+    results = []
+    for size in sizes:
+        for distribution in distributions:
+            data = DISTRIBUTIONS[distribution](size, random.Random(seed))
+            for name, case in cases.items():
+                if case.max_size is not None and size > case.max_size:
+                    continue
+                record = {"algorithm": name, "distribution": distribution, "size": size}
+                record.update(measure(case, data, repeat, comparison_limit))
+                results.append(record)
+    return results
+
+
+def run_search_benchmarks(
+    cases: dict[str, Callable[[object, SortedArray], int | None]],
+    distributions: list[str],
+    sizes: list[int],
+    repeat: int = 3,
+    seed: int = 0,
+    lookups: int = DEFAULT_LOOKUPS,
+) -> list[dict]:
+    """Time lookups of existing keys and count the average number of probes per lookup."""
+    results = []
+    for size in sizes:
+        if size < 1:
+            continue
+        for distribution in distributions:
+            rng = random.Random(seed)
+            data = SEARCH_DISTRIBUTIONS[distribution](size, rng)
+            keys = [rng.choice(data) for _ in range(lookups)]
+            table = SortedArray.from_sorted(data)
+            counted = CountingSortedArray.from_sorted(data)
+            for name, search in cases.items():
+                best = float("inf")
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    for key in keys:
+                        search(key, table)
+                    best = min(best, time.perf_counter() - start)
+
+                CountingSortedArray.probes = 0
+                for key in keys:
+                    search(key, counted)
+                results.append(
+                    {
+                        "algorithm": name,
+                        "distribution": distribution,
+                        "size": size,
+                        "seconds": best,
+                        "probes": CountingSortedArray.probes / len(keys),
+                    }
+                )
+    return results
+
+
+def run_fibonacci_benchmarks(
+    cases: dict[str, BenchmarkCase], sizes: list[int], repeat: int = 3
+) -> list[dict]:
+    """Time the computation of F(n) for every n in sizes."""
+    results = []
+    for n in sizes:
+        for name, case in cases.items():
+            if n < 0 or (case.max_size is not None and n > case.max_size):
+                continue
+            best = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                case.run(n)
+                best = min(best, time.perf_counter() - start)
+            results.append({"algorithm": name, "distribution": "n", "size": n, "seconds": best})
+    return results
+
+
+def find_regressions(
+    results: list[dict],
+    baseline: list[dict],
+    threshold: float = DEFAULT_THRESHOLD,
+    min_seconds: float = DEFAULT_MIN_SECONDS,
+) -> list[dict]:
+    """Return results that are more than threshold slower than the matching baseline entry."""
+    reference = {
+        (entry["algorithm"], entry["distribution"], entry["size"]): entry for entry in baseline
+    }
+    regressions = []
+    for record in results:
+        previous = reference.get((record["algorithm"], record["distribution"], record["size"]))
+        if previous is None or previous["seconds"] < min_seconds:
+            continue
+        slowdown = record["seconds"] / previous["seconds"] - 1
+        if slowdown > threshold:
+            regressions.append({**record, "baseline_seconds": previous["seconds"], "slowdown": slowdown})
+    return regressions
+
+
+SUITES: dict[str, tuple[dict, dict]] = {
+    "sort": (SORT_CASES, DISTRIBUTIONS),
+    "search": (SEARCH_CASES, SEARCH_DISTRIBUTIONS),
+    "fibonacci": (FIBONACCI_CASES, {}),
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark the algorithms in core.algorithms.")
+    parser.add_argument("--suite", choices=list(SUITES), default="sort")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument(
+        "--algorithms", nargs="+", choices=sorted({**SORT_CASES, **SEARCH_CASES, **FIBONACCI_CASES})
+    )
+    parser.add_argument(
+        "--distributions", nargs="+", choices=list({**DISTRIBUTIONS, **SEARCH_DISTRIBUTIONS})
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--comparison-limit", type=int, default=DEFAULT_COMPARISON_LIMIT)
+    parser.add_argument("--lookups", type=int, default=DEFAULT_LOOKUPS)
+    parser.add_argument("--output", help="Write the results to this JSON file.")
+    parser.add_argument("--baseline", help="Compare against a JSON file written by --output.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--min-seconds", type=float, default=DEFAULT_MIN_SECONDS)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    all_cases, all_distributions = SUITES[args.suite]
+    names = args.algorithms or list(all_cases)
+    distributions = args.distributions or list(all_distributions)
+    unknown = [name for name in names + distributions if name not in {**all_cases, **all_distributions}]
+    if unknown:
+        parser.error(f"not part of the {args.suite} suite: {', '.join(unknown)}")
+    cases = {name: all_cases[name] for name in names}
+
+    if args.suite == "sort":
+        results = run_benchmarks(
+            cases, distributions, args.sizes, args.repeat, args.seed, args.comparison_limit
+        )
+        for record in results:
+            comparisons = "-" if record["comparisons"] is None else record["comparisons"]
+            print(
+                f"{record['algorithm']:<22} {record['distribution']:<14} {record['size']:>10} "
+                f"{record['seconds']:>12.6f}s {record['peak_bytes']:>12}B {comparisons:>12}"
+            )
+    elif args.suite == "search":
+        results = run_search_benchmarks(
+            cases, distributions, args.sizes, args.repeat, args.seed, args.lookups
+        )
+        for record in results:
+            print(
+                f"{record['algorithm']:<22} {record['distribution']:<14} {record['size']:>10} "
+                f"{record['seconds']:>12.6f}s {record['probes']:>10.2f} probes/lookup"
+            )
+    else:
+        results = run_fibonacci_benchmarks(cases, args.sizes, args.repeat)
+        for record in results:
+            print(f"{record['algorithm']:<24} n={record['size']:<10} {record['seconds']:>12.6f}s")
+
+    if args.output:
+        report = {
+            "metadata": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "suite": args.suite,
+                "seed": args.seed,
+                "repeat": args.repeat,
+            },
+            "results": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as file:
+            baseline = json.load(file)["results"]
+        regressions = find_regressions(results, baseline, args.threshold, args.min_seconds)
+        for record in regressions:
+            print(
+                f"REGRESSION {record['algorithm']} {record['distribution']} {record['size']}: "
+                f"{record['seconds']:.6f}s vs {record['baseline_seconds']:.6f}s "
+                f"(+{record['slowdown']:.0%})"
+            )
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
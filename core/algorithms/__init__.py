@@ -1,16 +1,95 @@
-from .fibonacci_methods import fibonacci_iterative, fibonacci_recursive
-from .list_analysis_functions import find_max, is_sorted
-from .search_algorithms import binary_search, linear_search
-from .sorting_algorithms_recursion import bubble_sort, merge_sort, quick_sort
+from .external_sort import LineCodec, StructCodec, external_sort, iter_external_sort
+from .fibonacci_methods import (
+    FIBONACCI_CACHE,
+    FibonacciCache,
+    fibonacci,
+    fibonacci_cached,
+    fibonacci_fast_doubling,
+    fibonacci_iterative,
+    fibonacci_many,
+    fibonacci_matrix,
+    fibonacci_mod,
+    fibonacci_range,
+    fibonacci_recursive,
+    fibonacci_sequence,
+)
+from .list_analysis_functions import (
+    find_max,
+    is_sorted,
+    parallel_summarize,
+    sortedness_profile,
+    summarize,
+)
+from .numeric_sort import numeric_sort
+from .parallel_search import parallel_linear_search
+from .parallel_sort import parallel_sort
+from .rolling_statistics import QuantileSketch, RollingStatistics
+from .search_algorithms import (
+    EytzingerIndex,
+    NOT_FOUND,
+    SearchIndex,
+    SortedArray,
+    binary_search,
+    binary_search_many,
+    exponential_search,
+    interpolation_search,
+    linear_search,
+    linear_search_stream,
+)
+from .selection_algorithms import nth_element, partial_sort, top_k
+from .sorting_algorithms_recursion import (
+    adaptive_sort,
+    bottom_up_merge_sort,
+    bubble_sort,
+    merge_sort,
+    quick_sort,
+)
+from .stream_merge import merge_sorted
 
 __all__ = [
+    "EytzingerIndex",
+    "FIBONACCI_CACHE",
+    "FibonacciCache",
+    "LineCodec",
+    "NOT_FOUND",
+    "QuantileSketch",
+    "RollingStatistics",
+    "SearchIndex",
+    "SortedArray",
+    "StructCodec",
+    "adaptive_sort",
     "binary_search",
+    "binary_search_many",
+    "bottom_up_merge_sort",
     "bubble_sort",
+    "exponential_search",
+    "external_sort",
+    "fibonacci",
+    "fibonacci_cached",
+    "fibonacci_fast_doubling",
     "fibonacci_iterative",
+    "fibonacci_many",
+    "fibonacci_matrix",
+    "fibonacci_mod",
+    "fibonacci_range",
     "fibonacci_recursive",
+    "fibonacci_sequence",
     "find_max",
+    "interpolation_search",
     "is_sorted",
+    "iter_external_sort",
     "linear_search",
+    "linear_search_stream",
     "merge_sort",
+    "merge_sorted",
+    "nth_element",
+    "numeric_sort",
+    "parallel_linear_search",
+    "parallel_sort",
+    "parallel_summarize",
+    "partial_sort",
     "quick_sort",
+    "sortedness_profile",
+    "summarize",
+    "top_k",
 ]
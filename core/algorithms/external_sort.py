@@ -0,0 +1,214 @@
+import os
+import struct
+import sys
+import tempfile
+from contextlib import ExitStack
+
+from .sorting_algorithms_recursion import adaptive_sort
+from .stream_merge import merge_sorted
+
+_DEFAULT_MEMORY_LIMIT = 64 * 1024 * 1024
+_DEFAULT_FAN_IN = 64
+_READ_BATCH = 4096
+
+
+class LineCodec:
+    """Newline-delimited text records, yielded without their trailing newline."""
+
+    def __init__(self, encoding="utf-8"):
+        self.encoding = encoding
+
+    def open(self, path, mode):
+        return open(path, mode, encoding=self.encoding)
+
+    def read(self, stream):
+        for line in stream:
+            yield line[:-1] if line.endswith("\n") else line
+
+    def write(self, stream, records):
+        for record in records:
+            stream.write(record)
+            stream.write("\n")
+
+    def size(self, record):
+        return sys.getsizeof(record)
+
+
+class StructCodec:
+    """Fixed-width binary records packed with a ``struct`` format, yielded as tuples."""
+
+    def __init__(self, fmt):
+        self.struct = struct.Struct(fmt)
+
+    def open(self, path, mode):
+        return open(path, mode + "b")
+
+    def read(self, stream):
+        record_size = self.struct.size
+        while True:
+            block = stream.read(record_size * _READ_BATCH)
+            if not block:
+                return
+            if len(block) % record_size:
+                raise ValueError("input ends with a partial record")
+            yield from self.struct.iter_unpack(block)
+
+    def write(self, stream, records):
+        pack = self.struct.pack
+        for record in records:
+            stream.write(pack(*record))
+
+    def size(self, record):
+        return sys.getsizeof(record) + sum(sys.getsizeof(field) for field in record)
+
+
+def _read_records(source, codec, stack):
+    """Return an iterator over the records of a path or an already open stream."""
+    if hasattr(source, "read"):
+        return codec.read(source)
+    return codec.read(stack.enter_context(codec.open(source, "r")))
+
+
+def _write_run(records, codec, directory, index):
+    """Write records to a new run file in directory and return its path."""
+    path = os.path.join(directory, f"run-{index:06d}")
+    with codec.open(path, "w") as stream:
+        codec.write(stream, records)
+    return path
+
+
+def _merge_runs(paths, codec):
+    """Yield the records of the sorted run files in paths in merged order."""
+    with ExitStack() as stack:
+        streams = [stack.enter_context(codec.open(path, "r")) for path in paths]
+        yield from merge_sorted(*(codec.read(stream) for stream in streams))
+
+
+def iter_external_sort(
+    source,
+    codec=None,
+    memory_limit=_DEFAULT_MEMORY_LIMIT,
+    fan_in=_DEFAULT_FAN_IN,
+    sort=adaptive_sort,
+    temp_dir=None,
+):
+    """
+    Lazily yields the records of a file in sorted order using an external (out-of-core) merge sort.
+    Records are read in chunks that fit in ``memory_limit``, each chunk is sorted in memory and
+    spilled to a temporary run file, and the runs are then streamed through a heap-based k-way
+    merge. When there are more runs than ``fan_in``, intermediate merge passes combine them
+    first so that no more than ``fan_in`` files are ever open at once. Temporary files are
+    removed when the generator is exhausted or closed.
+    Args:
+        source (str, os.PathLike or file object): The input path or an open stream.
+        codec (LineCodec or StructCodec, optional): How records are read and written.
+        Defaults to ``LineCodec()``.
+        memory_limit (int, optional): Approximate number of bytes of records held in memory.
+        fan_in (int, optional): Maximum number of runs merged at once.
+        sort (callable, optional): In-memory sort applied to each chunk. Defaults to
+        ``adaptive_sort``.
+        temp_dir (str, optional): Directory in which run files are created.
+
+    Yields:
+        The records in sorted order.
+
+    Raises:
+        ValueError: If ``memory_limit`` is not positive or ``fan_in`` is less than 2.
+    """
+    if memory_limit <= 0:
+        raise ValueError("memory_limit must be positive")
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+    codec = codec or LineCodec()
+
+    with ExitStack() as stack:
+        records = _read_records(source, codec, stack)
+        directory = None
+        paths = []
+        chunk = []
+        used = 0
+        for record in records:
+            chunk.append(record)
+            used += codec.size(record) + 8
+            if used >= memory_limit:
+                if directory is None:
+                    directory = stack.enter_context(tempfile.TemporaryDirectory(dir=temp_dir))
+                paths.append(_write_run(sort(chunk), codec, directory, len(paths)))
+                chunk = []
+                used = 0
+
+        if not paths:
+            # Everything fit in memory: no temporary files are needed.
+            yield from sort(chunk)
+            return
+        if chunk:
+            paths.append(_write_run(sort(chunk), codec, directory, len(paths)))
+        chunk = []
+
+        next_index = len(paths)
+        while len(paths) > fan_in:
+            merged_paths = []
+            for start in range(0, len(paths), fan_in):
+                group = paths[start : start + fan_in]
+                if len(group) == 1:
+                    merged_paths.append(group[0])
+                    continue
+                merged_paths.append(
+                    _write_run(_merge_runs(group, codec), codec, directory, next_index)
+                )
+                next_index += 1
+                for path in group:
+                    os.remove(path)
+            paths = merged_paths
+
+        yield from _merge_runs(paths, codec)
+
+
+def external_sort(source, destination, codec=None, **options):
+    """
+    Sorts a file that may be larger than memory and writes the result to another file.
+    Args:
+        source (str, os.PathLike or file object): The input path or an open stream.
+        destination (str, os.PathLike or file object): The output path or an open stream.
+        codec (LineCodec or StructCodec, optional): How records are read and written.
+        Defaults to ``LineCodec()``.
+        **options: ``memory_limit``, ``fan_in``, ``sort`` and ``temp_dir`` as accepted by
+        ``iter_external_sort``.
+
+    Returns:
+        int: The number of records written.
+    """
+    codec = codec or LineCodec()
+    count = 0
+
+    def counted(records):
+        nonlocal count
+        for record in records:
+            count += 1
+            yield record
+
+    sorted_records = counted(iter_external_sort(source, codec, **options))
+    if hasattr(destination, "write"):
+        codec.write(destination, sorted_records)
+    else:
+        with codec.open(destination, "w") as stream:
+            codec.write(stream, sorted_records)
+    return count
+
+
+def main():
+    """
+    Main function to demonstrate the external sort on a small temporary file.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "input.txt")
+        destination = os.path.join(directory, "output.txt")
+        with open(source, "w", encoding="utf-8") as stream:
+            stream.write("\n".join(["pear", "apple", "fig", "banana", "cherry", "date"]))
+        count = external_sort(source, destination, memory_limit=128, fan_in=2)
+        with open(destination, encoding="utf-8") as stream:
+            print(f"Sorted {count} records:", stream.read().split())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,8 @@
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+
 def fibonacci_recursive(n, memo=None):
     """
     Recursively calculates the nth Fibonacci number using memoization to improve efficiency.
@@ -28,6 +33,7 @@ def fibonacci_recursive(n, memo=None):
 def fibonacci_iterative(n):
     """
     Iteratively calculates the nth Fibonacci number.
+    Only the two latest values are kept, so memory stays constant apart from the result.
     Args:
         n (int): The position in the Fibonacci sequence.
 
@@ -36,14 +42,373 @@ def fibonacci_iterative(n):
     """
     if n < 0:
         raise ValueError("Input must be a non-negative integer")
-    if n == 0:
-        return 0
-    elif n == 1:
-        return 1
-    fib = [0, 1]
-    for i in range(2, n + 1):
-        fib.append(fib[i - 1] + fib[i - 2])
-    return fib[n]
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+
+
+_LOOP_THRESHOLD = 20
+
+
+def _fibonacci_pair(n):
+    """Return (F(n), F(n + 1)) using fast doubling over the bits of n."""
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if bit == "1":
+            a, b = d, c + d
+        else:
+            a, b = c, d
+    return a, b
+
+
+def fibonacci_fast_doubling(n):
+    """
+    Calculates the nth Fibonacci number with the fast-doubling identities
+    F(2k) = F(k) * (2F(k+1) - F(k)) and F(2k+1) = F(k)^2 + F(k+1)^2.
+    The bits of n are walked from the most significant one, so only O(log n) big-integer
+    multiplications are needed and there is no recursion. The last step computes F(n) alone,
+    skipping the unused F(n+1).
+    Args:
+        n (int): The position in the Fibonacci sequence.
+
+    Returns:
+        int: The nth Fibonacci number.
+
+    Raises:
+        ValueError: If ``n`` is negative.
+    """
+    if n < 0:
+        raise ValueError("Input must be a non-negative integer")
+    a, b = _fibonacci_pair(n >> 1)
+    if n & 1:
+        return a * a + b * b
+    return a * (2 * b - a)
+
+
+def fibonacci_matrix(n):
+    """
+    Calculates the nth Fibonacci number by raising [[1, 1], [1, 0]] to the nth power.
+    Powers of this matrix are symmetric, so each one is stored as the triple (a, b, c) of
+    [[a, b], [b, c]] and exponentiation by squaring takes O(log n) multiplications.
+    Args:
+        n (int): The position in the Fibonacci sequence.
+
+    Returns:
+        int: The nth Fibonacci number.
+
+    Raises:
+        ValueError: If ``n`` is negative.
+    """
+    if n < 0:
+        raise ValueError("Input must be a non-negative integer")
+    result = (1, 0, 1)
+    base = (1, 1, 0)
+    while n:
+        if n & 1:
+            a, b, c = result
+            x, y, z = base
+            result = (a * x + b * y, a * y + b * z, b * y + c * z)
+        n >>= 1
+        if n:
+            a, b, c = base
+            bb = b * b
+            base = (a * a + bb, b * (a + c), bb + c * c)
+    return result[1]
+
+
+_METHODS = {
+    "fast_doubling": fibonacci_fast_doubling,
+    "matrix": fibonacci_matrix,
+    "iterative": fibonacci_iterative,
+    "recursive": fibonacci_recursive,
+}
+
+
+def fibonacci(n, method="auto"):
+    """
+    Calculates the nth Fibonacci number with the chosen method.
+    With ``method="auto"`` the iterative addition loop is used below n = 20, where it beats the
+    multiplication-based methods, and fast doubling above it. The matrix method does more
+    multiplications per bit than fast doubling, so it is never picked automatically.
+    Args:
+        n (int): The position in the Fibonacci sequence.
+        method (str, optional): One of ``"auto"``, ``"fast_doubling"``, ``"matrix"``,
+        ``"iterative"`` or ``"recursive"``.
+
+    Returns:
+        int: The nth Fibonacci number.
+
+    Raises:
+        ValueError: If ``n`` is negative or ``method`` is unknown.
+    """
+    if method == "auto":
+        if n < 0:
+            raise ValueError("Input must be a non-negative integer")
+        if n < _LOOP_THRESHOLD:
+            return fibonacci_iterative(n)
+        return fibonacci_fast_doubling(n)
+    try:
+        calculate = _METHODS[method]
+    except KeyError:
+        raise ValueError(f"Unknown Fibonacci method: {method!r}") from None
+    return calculate(n)
+
+
+class FibonacciCache:
+    """
+    A thread-safe, size-bounded LRU cache of Fibonacci numbers with hit/miss statistics.
+    Values are computed outside the lock, so a slow miss never blocks lookups from other
+    threads; two threads missing on the same n may both compute it, which is harmless.
+    """
+
+    def __init__(self, maxsize=1024, compute=None):
+        """
+        Args:
+            maxsize (int, optional): Maximum number of cached values.
+            compute (callable, optional): Function computing F(n) on a miss. Defaults to
+            ``fibonacci``.
+
+        Raises:
+            ValueError: If ``maxsize`` is not positive.
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self._compute = compute or fibonacci
+        self._values = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._values)
+
+    def __contains__(self, n):
+        return n in self._values
+
+    def get(self, n):
+        """Return F(n), computing and caching it on a miss."""
+        with self._lock:
+            if n in self._values:
+                self._values.move_to_end(n)
+                self.hits += 1
+                return self._values[n]
+            self.misses += 1
+        value = self._compute(n)
+        with self._lock:
+            self._values[n] = value
+            self._values.move_to_end(n)
+            while len(self._values) > self.maxsize:
+                self._values.popitem(last=False)
+        return value
+
+    def info(self):
+        """Return a dict with the hit and miss counts and the current and maximum size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._values),
+                "maxsize": self.maxsize,
+            }
+
+    def clear(self):
+        """Drop every cached value and reset the statistics."""
+        with self._lock:
+            self._values.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+FIBONACCI_CACHE = FibonacciCache()
+
+
+def fibonacci_cached(n):
+    """
+    Calculates the nth Fibonacci number through the process-wide ``FIBONACCI_CACHE``.
+    Repeated queries in a long-running process are answered from the cache instead of being
+    recomputed; use ``FIBONACCI_CACHE.info()`` to inspect its statistics.
+    Args:
+        n (int): The position in the Fibonacci sequence.
+
+    Returns:
+        int: The nth Fibonacci number.
+
+    Raises:
+        ValueError: If ``n`` is negative.
+    """
+    if n < 0:
+        raise ValueError("Input must be a non-negative integer")
+    return FIBONACCI_CACHE.get(n)
+
+
+_PISANO_LIMIT = 1 << 32
+
+
+def _fibonacci_pair_mod(n, m):
+    """Return (F(n) mod m, F(n + 1) mod m) using fast doubling over the bits of n."""
+    a, b = 0, 1 % m
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a) % m
+        d = (a * a + b * b) % m
+        if bit == "1":
+            a, b = d, (c + d) % m
+        else:
+            a, b = c, d
+    return a, b
+
+
+def _prime_factors(n):
+    """Return the prime factorization of n as a {prime: exponent} dict, by trial division."""
+    factors = {}
+    divisor = 2
+    while divisor * divisor <= n:
+        while n % divisor == 0:
+            factors[divisor] = factors.get(divisor, 0) + 1
+            n //= divisor
+        divisor += 1 if divisor == 2 else 2
+    if n > 1:
+        factors[n] = factors.get(n, 0) + 1
+    return factors
+
+
+def _prime_pisano_period(p):
+    """Return the Pisano period of the prime p."""
+    if p == 2:
+        return 3
+    if p == 5:
+        return 20
+    # The period divides p - 1 when p = +-1 (mod 5) and 2(p + 1) otherwise;
+    # strip prime factors from that bound for as long as it stays a period.
+    period = p - 1 if p % 5 in (1, 4) else 2 * (p + 1)
+    for q in _prime_factors(period):
+        while period % q == 0 and _fibonacci_pair_mod(period // q, p) == (0, 1):
+            period //= q
+    return period
+
+
+@lru_cache(maxsize=256)
+def _pisano_period(m):
+    """
+    Return the Pisano period of m as the lcm of the periods of its prime powers.
+    Uses pi(p**k) = p**(k - 1) * pi(p), which is at worst a multiple of the true period (only
+    for a Wall-Sun-Sun prime, none known) and so is always safe for reducing n.
+    """
+    period = 1
+    for p, exponent in _prime_factors(m).items():
+        prime_power_period = _prime_pisano_period(p) * p ** (exponent - 1)
+        a, b = period, prime_power_period
+        while b:
+            a, b = b, a % b
+        period = period // a * prime_power_period
+    return period
+
+
+def fibonacci_mod(n, m):
+    """
+    Calculates the nth Fibonacci number modulo m without building large integers.
+    For moduli below 2**32, n is first reduced by the Pisano period of m (the period of the
+    Fibonacci sequence mod m, found from the factorization of m and cached per modulus); the
+    result then comes from fast doubling with every product reduced mod m, in O(log n) steps.
+    Args:
+        n (int): The position in the Fibonacci sequence.
+        m (int): The modulus.
+
+    Returns:
+        int: F(n) mod m.
+
+    Raises:
+        ValueError: If ``n`` is negative or ``m`` is not positive.
+    """
+    if n < 0:
+        raise ValueError("Input must be a non-negative integer")
+    if m < 1:
+        raise ValueError("Modulus must be a positive integer")
+    if m < _PISANO_LIMIT:
+        n %= _pisano_period(m)
+    return _fibonacci_pair_mod(n, m)[0]
+
+
+def fibonacci_sequence(start=0, stop=None):
+    """
+    Lazily yields the Fibonacci numbers F(start), F(start + 1), ... up to F(stop - 1).
+    The generator jumps to ``start`` with fast doubling in O(log start) multiplications and
+    then keeps only two running values, so the prefix is never computed one step at a time
+    or stored.
+    Args:
+        start (int, optional): The first position to yield. Defaults to 0.
+        stop (int, optional): The position to stop before. Defaults to None (never stop).
+
+    Yields:
+        int: The Fibonacci numbers in order.
+
+    Raises:
+        ValueError: If ``start`` is negative.
+    """
+    if start < 0:
+        raise ValueError("Input must be a non-negative integer")
+    a, b = _fibonacci_pair(start)
+    if stop is None:
+        while True:
+            yield a
+            a, b = b, a + b
+    for _ in range(start, stop):
+        yield a
+        a, b = b, a + b
+
+
+def fibonacci_range(a, b):
+    """
+    Returns the Fibonacci numbers F(a) through F(b - 1) without computing the prefix before a.
+    Args:
+        a (int): The first position.
+        b (int): The position to stop before.
+
+    Returns:
+        list: The Fibonacci numbers, empty if ``b <= a``.
+
+    Raises:
+        ValueError: If ``a`` is negative.
+    """
+    return list(fibonacci_sequence(a, b))
+
+
+def fibonacci_many(ns):
+    """
+    Calculates the Fibonacci numbers for a batch of positions in one pass.
+    The distinct positions are visited in ascending order while a single running pair
+    (F(k), F(k + 1)) is carried forward: short gaps are crossed with additions and longer ones
+    in one jump with F(k + g) = F(k + 1) F(g) + F(k) F(g - 1), where (F(g), F(g + 1)) comes
+    from fast doubling. The batch therefore costs about O(max n) additions or O(k log n)
+    multiplications instead of one full computation per position.
+    Args:
+        ns (iterable): The positions in the Fibonacci sequence, in any order, repeats allowed.
+
+    Returns:
+        list: The Fibonacci numbers, in the order of ``ns``.
+
+    Raises:
+        ValueError: If any position is negative.
+    """
+    ns = list(ns)
+    if any(n < 0 for n in ns):
+        raise ValueError("Input must be a non-negative integer")
+    values = {}
+    current, a, b = 0, 0, 1
+    for n in sorted(set(ns)):
+        gap = n - current
+        if gap < _LOOP_THRESHOLD:
+            for _ in range(gap):
+                a, b = b, a + b
+        else:
+            f_gap, f_next = _fibonacci_pair(gap)
+            a, b = b * f_gap + a * (f_next - f_gap), b * f_next + a * f_gap
+        current = n
+        values[n] = a
+    return [values[n] for n in ns]
 
 
 def main():
@@ -56,6 +421,10 @@ def main():
             )
         except ValueError as e:
             print(e)
+    print("Fibonacci 10**18 mod 1_000_000_007:", fibonacci_mod(10**18, 1_000_000_007))
+    print("Fibonacci of 30, 3, 10, 3:", fibonacci_many([30, 3, 10, 3]))
+    print("Fibonacci 100..104:", fibonacci_range(100, 105))
+    print(f"Fibonacci 1000 has {len(str(fibonacci(1000)))} digits")
 
 
 if __name__ == "__main__":
@@ -1,35 +1,426 @@
+import operator
+import os
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from itertools import compress, count, islice, tee
+from multiprocessing.shared_memory import SharedMemory
+
+from .shared_buffers import (
+    SUPPORTED_TYPECODES,
+    buffer_typecode,
+    read_chunk,
+    shared_copy,
+    split_range,
+)
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+_SUMMARY_CHUNK = 1 << 16
+_INVERSION_BLOCK = 32
+# Below about 8M items the C-level reductions finish before worker processes can start.
+_PARALLEL_THRESHOLD = 1 << 23
+
+
 def is_sorted(items):
     """
-    Checks if the given list of items is sorted in non-decreasing order.
+    Checks if the given items are sorted in non-decreasing order.
+    Neighbouring items are compared pairwise in C without indexing or recursion, so any
+    iterable of any length can be checked, stopping at the first out-of-order pair.
     Args:
-        items (list): The list to be checked.
+        items (iterable): The items to be checked.
 
     Returns:
-        bool: True if the list is sorted, False otherwise.
+        bool: True if the items are sorted, False otherwise.
     """
-    if not items:  # Handle the case for an empty list
-        return True  # An empty list is considered sorted
-    return all(items[i] <= items[i + 1] for i in range(len(items) - 1))
+    if isinstance(items, (list, tuple, array)):
+        return all(map(operator.le, items, islice(items, 1, None)))
+    current, following = tee(items)
+    next(following, None)
+    return all(map(operator.le, current, following))
 
 
 def find_max(items):
     """
-    Finds the maximum value in a list using a recursive approach.
+    Finds the maximum value in the given items with a single iterative pass.
+    Args:
+        items (iterable): The items from which to find the maximum value.
+
+    Returns:
+        int or None: The maximum value found, or None if there are no items.
+    """
+    return max(items, default=None)
+
+
+def _empty_summary():
+    """Return the summary of an empty input."""
+    return {
+        "count": 0,
+        "sum": 0,
+        "min": None,
+        "max": None,
+        "argmin": None,
+        "argmax": None,
+        "is_sorted": True,
+    }
+
+
+def _summarize_numpy(items):
+    """Summarize a one-dimensional numeric NumPy array with vectorized reductions."""
+    if not len(items):
+        return _empty_summary()
+    argmin = int(items.argmin())
+    argmax = int(items.argmax())
+    return {
+        "count": len(items),
+        "sum": items.sum().item(),
+        "min": items[argmin].item(),
+        "max": items[argmax].item(),
+        "argmin": argmin,
+        "argmax": argmax,
+        "is_sorted": bool(np.all(items[:-1] <= items[1:])),
+    }
+
+
+def _summarize_chunked(items, continues=False):
+    """
+    Summarize a list, tuple or array chunk by chunk with C-level built-ins.
+    A NaN never replaces a running extreme, so NaNs at the start of a chunk are skipped unless
+    they open the whole input (or, with ``continues`` unset, this part of it).
+    """
+    summary = _empty_summary()
+    summary["count"] = len(items)
+    total = 0
+    previous = None
+    for lo in range(0, len(items), _SUMMARY_CHUNK):
+        chunk = items[lo : lo + _SUMMARY_CHUNK]
+        start = 0
+        if continues or lo:
+            while start < len(chunk) and chunk[start] != chunk[start]:
+                start += 1
+        if start < len(chunk):
+            values = chunk[start:] if start else chunk
+            low = min(values)
+            high = max(values)
+            if summary["argmin"] is None or low < summary["min"]:
+                summary["min"], summary["argmin"] = low, lo + start + _position(values, low)
+            if summary["argmax"] is None or high > summary["max"]:
+                summary["max"], summary["argmax"] = high, lo + start + _position(values, high)
+        if total is not None:
+            try:
+                total += sum(chunk)
+            except TypeError:
+                total = None
+        if summary["is_sorted"]:
+            summary["is_sorted"] = (lo == 0 or previous <= chunk[0]) and all(
+                map(operator.le, chunk, islice(chunk, 1, None))
+            )
+        previous = chunk[-1]
+    summary["sum"] = total
+    return summary
+
+
+def _position(values, extreme):
+    """Return the first position of extreme, found by min or max, in values."""
+    # min and max only return a NaN when it comes first, and NaN equals nothing.
+    return 0 if extreme != extreme else values.index(extreme)
+
+
+def summarize(iterable, key=None):
+    """
+    Computes count, sum, minimum, maximum, their positions and sortedness in one pass.
+    Any iterable is accepted, including generators and file streams, which are consumed
+    lazily. Lists, tuples and ``array.array`` without a key are processed in fixed-size chunks
+    with C-level ``min``/``max``/``sum``, and one-dimensional numeric NumPy arrays with
+    vectorized reductions, instead of a Python-level loop per item.
+    Args:
+        iterable (iterable): The items to summarize.
+        key (callable, optional): Function computing the value compared and summed for each
+        item; ``min`` and ``max`` are still the items themselves.
+
+    Returns:
+        dict: ``count``, ``sum`` (None if the values cannot be added), ``min``, ``max``,
+        ``argmin`` and ``argmax`` (first positions, None when empty) and ``is_sorted``
+        (non-decreasing by value).
+    """
+    if key is None:
+        if NUMPY_AVAILABLE and isinstance(iterable, np.ndarray) and iterable.ndim == 1:
+            if iterable.dtype.kind in "biuf":
+                return _summarize_numpy(iterable)
+        if isinstance(iterable, (list, tuple, array)):
+            return _summarize_chunked(iterable)
+
+    summary = _empty_summary()
+    total = 0
+    for index, item in enumerate(iterable):
+        value = item if key is None else key(item)
+        if index == 0:
+            low = high = previous = value
+            summary["min"] = summary["max"] = item
+            summary["argmin"] = summary["argmax"] = 0
+        else:
+            if value < low:
+                low, summary["min"], summary["argmin"] = value, item, index
+            elif value > high:
+                high, summary["max"], summary["argmax"] = value, item, index
+            if summary["is_sorted"] and not previous <= value:
+                summary["is_sorted"] = False
+            previous = value
+        if total is not None:
+            try:
+                total += value
+            except TypeError:
+                total = None
+        summary["count"] = index + 1
+    summary["sum"] = total
+    return summary
+
+
+def _merge_counting(left, right):
+    """Merge two sorted lists, returning the merged list and the number of cross inversions."""
+    merged = []
+    inversions = 0
+    i = 0
+    for value in right:
+        while i < len(left) and left[i] <= value:
+            merged.append(left[i])
+            i += 1
+        # The value is inverted with every left item not yet taken.
+        inversions += len(left) - i
+        merged.append(value)
+    merged.extend(left[i:])
+    return merged, inversions
+
+
+def _count_inversions(values):
+    """Return the number of pairs i < j with values[i] > values[j], by bottom-up merge counting."""
+    inversions = 0
+    blocks = []
+    for lo in range(0, len(values), _INVERSION_BLOCK):
+        block = []
+        for value in values[lo : lo + _INVERSION_BLOCK]:
+            position = bisect_right(block, value)
+            inversions += len(block) - position
+            block.insert(position, value)
+        blocks.append(block)
+    while len(blocks) > 1:
+        merged = []
+        for i in range(0, len(blocks) - 1, 2):
+            block, cross = _merge_counting(blocks[i], blocks[i + 1])
+            inversions += cross
+            merged.append(block)
+        if len(blocks) % 2:
+            merged.append(blocks[-1])
+        blocks = merged
+    return inversions
+
+
+def _first_descent(items):
+    """Return the index of the first item greater than its successor, or None, lazily."""
+    if NUMPY_AVAILABLE and isinstance(items, np.ndarray) and items.ndim == 1:
+        descents = items[1:] < items[:-1]
+        return int(descents.argmax()) if descents.any() else None
+    if isinstance(items, (list, tuple, array)):
+        current, following = items, islice(items, 1, None)
+    else:
+        current, following = tee(items)
+        next(following, None)
+    return next(compress(count(), map(operator.gt, current, following)), None)
+
+
+def _count_inversions_numpy(items):
+    """Return the inversion count of a NumPy array, merging sorted blocks level by level."""
+    size = len(items)
+    ranks = np.empty(size, dtype=np.int64)
+    ranks[np.argsort(items, kind="stable")] = np.arange(size)
+    positions = np.arange(size)
+    inversions = 0
+    width = 1
+    while width < size:
+        pair = positions // (2 * width)
+        keys = pair * size + ranks
+        is_right = (positions // width) % 2 == 1
+        left_keys = keys[~is_right]
+        right_pair = pair[is_right]
+        greater = np.searchsorted(left_keys, (right_pair + 1) * size) - np.searchsorted(
+            left_keys, keys[is_right], side="right"
+        )
+        inversions += int(greater.sum())
+        ranks = np.sort(keys, kind="stable") - pair * size
+        width *= 2
+    return inversions
+
+
+def _monotone_runs(descents):
+    """
+    Return the lengths of the runs adaptive_sort would find, negative for strictly descending
+    ones, given ``descents[i]`` telling whether item i is greater than item i + 1.
+    """
+    size = len(descents) + 1
+    runs = []
+    lo = 0
+    while lo < size:
+        descending = lo < size - 1 and descents[lo]
+        try:
+            # Each run ends at the first pair that breaks its direction.
+            end = descents.index(not descending, lo)
+        except ValueError:
+            end = size - 1
+        runs.append(lo - end - 1 if descending else end - lo + 1)
+        lo = end + 1
+    return runs
+
+
+def sortedness_profile(items, count_inversions=True, first_descent_only=False):
+    """
+    Describes how far the items are from sorted order, e.g. to choose a sorting strategy.
+    Descents (items greater than their successor) are located with C-level pairwise
+    comparisons, runs are split the way ``adaptive_sort`` finds them (non-decreasing or
+    strictly descending), and the exact inversion count uses O(n log n) merge counting. Sorted input
+    stops after the first linear scan. One-dimensional numeric NumPy arrays are profiled with
+    vectorized operations.
     Args:
-        items (list): The list from which to find the maximum value.
+        items (iterable): The items to profile. Iterators are materialized into a list unless
+        ``first_descent_only`` is set.
+        count_inversions (bool, optional): Compute the inversion count. Defaults to True.
+        first_descent_only (bool, optional): Stop at the first descent and fill in only
+        ``is_sorted`` and ``first_inversion``. Defaults to False.
 
     Returns:
-        int or None: The maximum value found in the list, or None if the list is empty.
+        dict: ``is_sorted``, ``first_inversion`` (index of the first item greater than its
+        successor, None if sorted), ``run_count`` and ``runs`` (lengths of the monotone runs,
+        negative for strictly descending ones) and ``inversions`` (number of pairs i < j with
+        ``items[i] > items[j]``). Values that were not computed are None.
+    """
+    if first_descent_only:
+        first = _first_descent(items)
+        return {
+            "is_sorted": first is None,
+            "first_inversion": first,
+            "run_count": None,
+            "runs": None,
+            "inversions": None,
+        }
+    if NUMPY_AVAILABLE and isinstance(items, np.ndarray) and items.ndim == 1:
+        descents = (items[1:] < items[:-1]).tolist()
+        count_all = _count_inversions_numpy
+    else:
+        if not isinstance(items, (list, tuple, array)):
+            items = list(items)
+        descents = list(map(operator.gt, items, islice(items, 1, None)))
+        count_all = _count_inversions
+
+    first = descents.index(True) if True in descents else None
+    inversions = None
+    if count_inversions:
+        inversions = 0 if first is None else count_all(items)
+    runs = _monotone_runs(descents) if len(items) else []
+    return {
+        "is_sorted": first is None,
+        "first_inversion": first,
+        "run_count": len(runs),
+        "runs": runs,
+        "inversions": inversions,
+    }
+
+
+def _summarize_shared(name, typecode, lo, hi):
+    """Worker: return the summary of items lo..hi of the shared buffer, and its first and last."""
+    chunk = read_chunk(name, typecode, lo, hi)
+    return _summarize_chunked(chunk, continues=lo > 0), chunk[0], chunk[-1]
+
+
+def _combine_summaries(parts, offsets):
+    """Combine per-chunk summaries, checking sortedness across chunk boundaries."""
+    combined = _empty_summary()
+    previous = None
+    for (summary, first, last), offset in zip(parts, offsets):
+        # A chunk of nothing but NaNs after the first one has no extremes to offer.
+        if summary["argmin"] is not None and (
+            combined["argmin"] is None or summary["min"] < combined["min"]
+        ):
+            combined["min"], combined["argmin"] = summary["min"], offset + summary["argmin"]
+        if summary["argmax"] is not None and (
+            combined["argmax"] is None or summary["max"] > combined["max"]
+        ):
+            combined["max"], combined["argmax"] = summary["max"], offset + summary["argmax"]
+        combined["is_sorted"] = (
+            combined["is_sorted"]
+            and summary["is_sorted"]
+            and (combined["count"] == 0 or previous <= first)
+        )
+        combined["count"] += summary["count"]
+        combined["sum"] += summary["sum"]
+        previous = last
+    return combined
+
+
+def _reduce_shared(name, typecode, length, workers, threshold):
+    """Summarize the first length items of a shared block, in worker processes if it pays off."""
+    if length == 0:
+        return _empty_summary()
+    if length < max(threshold, 1) or workers < 2:
+        return _combine_summaries([_summarize_shared(name, typecode, 0, length)], [0])
+    chunks = split_range(length, workers)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_summarize_shared, name, typecode, lo, hi) for lo, hi in chunks]
+        parts = [future.result() for future in futures]
+    return _combine_summaries(parts, [lo for lo, _ in chunks])
+
+
+def parallel_summarize(
+    data, workers=None, threshold=_PARALLEL_THRESHOLD, typecode=None, length=None
+):
+    """
+    Computes the same summary as ``summarize`` for a large numeric buffer on several cores.
+    Each worker process reduces one chunk of a ``multiprocessing.shared_memory`` block and
+    returns only its summary and its first and last items; the parent combines them, checking
+    sortedness across every chunk boundary. Passing a ``SharedMemory`` block is zero-copy;
+    other buffers are copied into one first. Lists, non-numeric data and inputs shorter than
+    ``threshold`` are summarized in-process by ``summarize``.
+    Args:
+        data (array.array, buffer or SharedMemory): The ints or floats to summarize.
+        workers (int, optional): Number of worker processes. Defaults to ``os.cpu_count()``.
+        threshold (int, optional): Minimum number of items for the parallel path.
+        typecode (str, optional): The ``array`` typecode of a ``SharedMemory`` block.
+        length (int, optional): The number of items in a ``SharedMemory`` block. Defaults to
+        as many as fit in it.
+
+    Returns:
+        dict: ``count``, ``sum``, ``min``, ``max``, ``argmin``, ``argmax`` and ``is_sorted``,
+        as returned by ``summarize``.
+
+    Raises:
+        ValueError: If ``data`` is a multi-dimensional buffer, or a ``SharedMemory`` block and
+        ``typecode`` is missing or unsupported or ``length`` does not fit in the block.
     """
-    if not items:
-        return None  # Return None if the list is empty
-    if len(items) == 1:
-        return items[0]  # Return the only element if the list contains one item
+    workers = workers or os.cpu_count() or 1
+    if isinstance(data, SharedMemory):
+        if typecode not in SUPPORTED_TYPECODES:
+            raise ValueError(f"unsupported typecode for a shared buffer: {typecode!r}")
+        capacity = data.size // array(typecode).itemsize
+        if length is None:
+            length = capacity
+        elif not 0 <= length <= capacity:
+            raise ValueError(f"length must be between 0 and {capacity} for this block")
+        return _reduce_shared(data.name, typecode, length, workers, threshold)
 
-    # Recursive case: Calculate the maximum of the first element and the max of the rest
-    op1 = items[0]
-    op2 = find_max(items[1:])
-    return op1 if op1 > op2 else op2
+    if isinstance(data, (list, tuple)):
+        return summarize(data)
+    try:
+        typecode = buffer_typecode(data)
+    except ValueError:
+        raise ValueError("parallel_summarize requires a one-dimensional buffer") from None
+    if typecode is None or len(data) < max(threshold, 1) or workers < 2:
+        return summarize(data)
+    with shared_copy(data) as shm:
+        return _reduce_shared(shm.name, typecode, len(data), workers, threshold)
 
 
 def main():
@@ -45,6 +436,11 @@ def main():
     ]
     for lst in test_lists:
         print(f"List: {lst} Is sorted: {is_sorted(lst)} Max value: {find_max(lst)}")
+    print("Summary of a generator:", summarize(value * value for value in range(-3, 4)))
+    print("Sortedness of [1, 3, 2, 4, 0]:", sortedness_profile([1, 3, 2, 4, 0]))
+    values = array("d", [2.5, 1.0, 4.0])
+    print("Parallel summary:", parallel_summarize(values, workers=2, threshold=0))
+    print("Summary by length:", summarize(["pear", "fig", "banana"], key=len))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,78 @@
+from array import array
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+_INT_TYPECODES = "bBhHiIlLqQ"
+_FLOAT_TYPECODES = "fd"
+
+
+def _classify(data):
+    """Return "int" or "float" for the element kind of data, raising TypeError otherwise."""
+    if NUMPY_AVAILABLE and isinstance(data, np.ndarray):
+        if data.dtype.kind in "iu":
+            return "int"
+        if data.dtype.kind == "f":
+            return "float"
+        raise TypeError(f"numeric_sort does not support dtype {data.dtype}")
+    if isinstance(data, array):
+        if data.typecode in _INT_TYPECODES:
+            return "int"
+        if data.typecode in _FLOAT_TYPECODES:
+            return "float"
+        raise TypeError(f"numeric_sort does not support typecode {data.typecode!r}")
+    if all(type(value) is int for value in data):
+        return "int"
+    if all(type(value) is float for value in data):
+        return "float"
+    raise TypeError("numeric_sort requires all ints or all floats")
+
+
+def numeric_sort(data):
+    """
+    Sorts a homogeneous sequence of ints or floats in place with a C-level sort.
+    NumPy arrays use ``ndarray.sort(kind="stable")``, which is a radix sort for integer dtypes
+    of 16 bits or less and timsort otherwise. Lists and array.array data use the built-in sort:
+    a radix sort written in Python, whose passes box every element, is slower than either.
+    Args:
+        data (list, array.array or numpy.ndarray): The numbers to be sorted.
+
+    Returns:
+        list, array.array or numpy.ndarray: ``data`` itself, sorted in place.
+
+    Raises:
+        TypeError: If the elements are not all ints or all floats.
+        ValueError: If ``data`` is a multi-dimensional NumPy array.
+    """
+    if NUMPY_AVAILABLE and isinstance(data, np.ndarray) and data.ndim != 1:
+        raise ValueError("numeric_sort requires a one-dimensional array")
+    if len(data) < 2:
+        return data
+    _classify(data)
+
+    if NUMPY_AVAILABLE and isinstance(data, np.ndarray):
+        data.sort(kind="stable")
+    elif isinstance(data, array):
+        data[:] = array(data.typecode, sorted(data))
+    else:
+        data.sort()
+    return data
+
+
+def main():
+    """
+    Main function to demonstrate the numeric sorting backend.
+    """
+    scores = [88, 92, 75, 100, 0, 63, 92, 75]
+    prices = array("d", [101.5, -3.25, 99.0, 0.0, -120.75, 3.5])
+    print("Scores sorted:", numeric_sort(scores))
+    print("Prices sorted:", numeric_sort(prices).tolist())
+
+
+if __name__ == "__main__":
+    main()
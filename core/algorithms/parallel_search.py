@@ -0,0 +1,116 @@
+import os
+from array import array
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing.shared_memory import SharedMemory
+
+from .search_algorithms import linear_search_stream
+from .shared_buffers import buffer_typecode, read_chunk, shared_block, shared_copy, split_range
+
+_PARALLEL_THRESHOLD = 1 << 22
+_CHUNK_SIZE = 1 << 20
+_BLOCK_SIZE = 1 << 16
+
+
+def _scan_chunk(data_name, control_name, typecode, item, chunk_id, lo, hi):
+    """
+    Worker: return the index of the first match in items lo..hi of the shared buffer, or None.
+    The scan runs block by block and gives up as soon as the parent publishes a hit in an
+    earlier chunk.
+    """
+    chunk = read_chunk(data_name, typecode, lo, hi)
+    control = SharedMemory(name=control_name)
+    best_chunk = control.buf.cast("q")
+    try:
+        for start in range(0, hi - lo, _BLOCK_SIZE):
+            if best_chunk[0] < chunk_id:
+                return None
+            try:
+                return lo + chunk.index(item, start, min(start + _BLOCK_SIZE, hi - lo))
+            except ValueError:
+                continue
+        return None
+    finally:
+        best_chunk.release()
+        control.close()
+
+
+def parallel_linear_search(
+    item, items, workers=None, threshold=_PARALLEL_THRESHOLD, chunk_size=_CHUNK_SIZE
+):
+    """
+    Performs a linear search over a large numeric buffer on several cores.
+    The buffer is copied once into ``multiprocessing.shared_memory`` and split into chunks that
+    worker processes scan in C. When a chunk reports a hit, every later chunk is cancelled (or
+    told through a shared control word to stop), and the search returns as soon as all earlier
+    chunks have reported misses, so the result is always the lowest matching index.
+    Python lists, which would first have to be packed into a buffer, and inputs shorter than
+    ``threshold`` are scanned in-process with ``linear_search_stream``.
+    Args:
+        item (int or float): The value to search for.
+        items (array.array or buffer): The values to scan, e.g. an ``array.array`` or NumPy array.
+        workers (int, optional): Number of worker processes. Defaults to ``os.cpu_count()``.
+        threshold (int, optional): Minimum length for the parallel path.
+        chunk_size (int, optional): Number of items per worker task.
+
+    Returns:
+        int or None: The index of the first match if found, None otherwise.
+
+    Raises:
+        ValueError: If ``items`` is a multi-dimensional buffer.
+    """
+    n = len(items)
+    workers = workers or os.cpu_count() or 1
+    typecode = None if isinstance(items, (list, tuple)) else buffer_typecode(items)
+    if typecode is None or n < max(threshold, 1) or workers < 2:
+        return linear_search_stream(item, items)
+
+    chunks = split_range(n, -(-n // max(chunk_size, 1)))
+    with shared_copy(items) as data, shared_block(8) as control:
+        best_chunk = control.buf.cast("q")
+        try:
+            best_chunk[0] = len(chunks)
+            best_index = None
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                pending = {
+                    pool.submit(
+                        _scan_chunk, data.name, control.name, typecode, item, chunk_id, lo, hi
+                    ): chunk_id
+                    for chunk_id, (lo, hi) in enumerate(chunks)
+                }
+                unresolved = set(range(len(chunks)))
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        chunk_id = pending.pop(future)
+                        unresolved.discard(chunk_id)
+                        if future.cancelled():
+                            continue
+                        hit = future.result()
+                        if hit is not None and chunk_id < best_chunk[0]:
+                            best_chunk[0] = chunk_id
+                            best_index = hit
+                            for other, other_id in pending.items():
+                                if other_id > chunk_id:
+                                    other.cancel()
+                    if not any(chunk_id < best_chunk[0] for chunk_id in unresolved):
+                        # Every earlier chunk has reported a miss: the hit is the lowest index.
+                        best_chunk[0] = -1
+                        for future in pending:
+                            future.cancel()
+                        break
+            return best_index
+        finally:
+            best_chunk.release()
+
+
+def main():
+    """
+    Main function to demonstrate the parallel linear search.
+    """
+    values = array("q", range(2_000_000))
+    print("Index of 1_500_000:", parallel_linear_search(1_500_000, values, workers=4, threshold=0))
+    print("Index of -1:", parallel_linear_search(-1, values, workers=4, threshold=0))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+import math
+import random
+from bisect import bisect_left, insort
+from collections import deque
+
+
+class QuantileSketch:
+    """
+    Approximate quantiles of a stream in bounded memory, using a hierarchy of compactors.
+    Level k holds items that each stand for 2**k pushed values. When a level fills up it is
+    sorted and every other item (starting at a random offset) is promoted to the next level,
+    so memory stays O(capacity * log(n / capacity)) while rank errors stay small and unbiased.
+    """
+
+    def __init__(self, capacity=200, seed=0):
+        """
+        Args:
+            capacity (int, optional): Items kept per level; larger is more accurate.
+            seed (int, optional): Seed for the random compaction offsets.
+
+        Raises:
+            ValueError: If ``capacity`` is less than 2.
+        """
+        if capacity < 2:
+            raise ValueError("capacity must be at least 2")
+        self.capacity = capacity
+        self._levels = [[]]
+        self._count = 0
+        self._rng = random.Random(seed)
+
+    def __len__(self):
+        return self._count
+
+    def _compact(self):
+        level = 0
+        while len(self._levels[level]) >= self.capacity:
+            items = self._levels[level]
+            items.sort()
+            # An odd item out stays behind so that no weight is lost.
+            kept = [items.pop()] if len(items) % 2 else []
+            promoted = items[self._rng.randrange(2) :: 2]
+            self._levels[level] = kept
+            if level + 1 == len(self._levels):
+                self._levels.append([])
+            self._levels[level + 1].extend(promoted)
+            level += 1
+
+    def push(self, value):
+        """Add one value to the sketch."""
+        self._levels[0].append(value)
+        self._count += 1
+        if len(self._levels[0]) >= self.capacity:
+            self._compact()
+
+    def extend(self, values):
+        """Add every value of an iterable to the sketch."""
+        for value in values:
+            self.push(value)
+
+    def quantile(self, q):
+        """
+        Return an approximate q-quantile of the values pushed so far.
+
+        Raises:
+            ValueError: If ``q`` is not between 0 and 1 or the sketch is empty.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        if not self._count:
+            raise ValueError("quantile of an empty sketch")
+        weighted = sorted(
+            (value, 1 << level) for level, items in enumerate(self._levels) for value in items
+        )
+        target = q * sum(weight for _, weight in weighted)
+        cumulative = 0
+        for value, weight in weighted:
+            cumulative += weight
+            if cumulative >= target:
+                return value
+        return weighted[-1][0]
+
+
+class RollingStatistics:
+    """
+    Incremental statistics over a sliding window of a stream, updated in O(1) amortized time.
+    The window holds the last ``window`` values, the values from the last ``time_window``
+    units of time, or both (whichever is smaller); without either, it covers the whole stream.
+    Maximum and minimum come from monotonic deques, mean and variance from Welford's algorithm
+    with removal, and the exponentially weighted moving average covers every pushed value.
+    Quantiles of a bounded window are exact: the window is sorted when ``quantile`` is called,
+    or kept sorted on every push with ``exact_quantiles=True`` (O(window) per push, for
+    frequent queries). Over an unbounded window they come from a ``QuantileSketch``.
+    """
+
+    def __init__(
+        self, window=None, time_window=None, alpha=0.1, sketch_capacity=200, exact_quantiles=False
+    ):
+        """
+        Args:
+            window (int, optional): Maximum number of values in the window.
+            time_window (float, optional): Maximum age of values in the window, in the units
+            of the timestamps passed to ``push``.
+            alpha (float, optional): Smoothing factor of the moving average, in (0, 1].
+            sketch_capacity (int, optional): Capacity of the quantile sketch used when the
+            window is unbounded.
+            exact_quantiles (bool, optional): Keep a sorted copy of a bounded window so that
+            ``quantile`` does not sort it on every call.
+
+        Raises:
+            ValueError: If ``window``, ``time_window`` or ``alpha`` is out of range.
+        """
+        if window is not None and window < 1:
+            raise ValueError("window must be positive")
+        if time_window is not None and time_window <= 0:
+            raise ValueError("time_window must be positive")
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        self.window = window
+        self.time_window = time_window
+        self.alpha = alpha
+        self._bounded = window is not None or time_window is not None
+        self._values = deque()
+        self._maxima = deque()
+        self._minima = deque()
+        self._sorted = [] if self._bounded and exact_quantiles else None
+        self._sketch = None if self._bounded else QuantileSketch(sketch_capacity)
+        self._next_index = 0
+        self._last_timestamp = None
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._ewma = None
+
+    def __len__(self):
+        return self._count
+
+    def _evict(self, timestamp):
+        oldest_kept = None if self.time_window is None else timestamp - self.time_window
+        while self._values and (
+            (self.window is not None and len(self._values) > self.window)
+            or (oldest_kept is not None and self._values[0][1] <= oldest_kept)
+        ):
+            index, _, value = self._values.popleft()
+            self._count -= 1
+            if self._count:
+                delta = value - self._mean
+                self._mean -= delta / self._count
+                self._m2 -= delta * (value - self._mean)
+            else:
+                self._mean = self._m2 = 0.0
+            if self._maxima[0][0] == index:
+                self._maxima.popleft()
+            if self._minima[0][0] == index:
+                self._minima.popleft()
+            if self._sorted is not None:
+                del self._sorted[bisect_left(self._sorted, value)]
+
+    def push(self, value, timestamp=None):
+        """
+        Add one value to the window, evicting values that fall out of it.
+
+        Raises:
+            ValueError: If a time window is used and ``timestamp`` is missing or earlier than
+            the previous one.
+        """
+        if self.time_window is not None:
+            if timestamp is None:
+                raise ValueError("a timestamp is required with a time window")
+            if self._last_timestamp is not None and timestamp < self._last_timestamp:
+                raise ValueError("timestamps must not decrease")
+            self._last_timestamp = timestamp
+        index = self._next_index
+        self._next_index += 1
+
+        self._count += 1
+        delta = value - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (value - self._mean)
+        self._ewma = value if self._ewma is None else self._ewma + self.alpha * (value - self._ewma)
+
+        while self._maxima and self._maxima[-1][1] <= value:
+            self._maxima.pop()
+        self._maxima.append((index, value))
+        while self._minima and self._minima[-1][1] >= value:
+            self._minima.pop()
+        self._minima.append((index, value))
+        if not self._bounded:
+            # Nothing is ever evicted, so only the running extremes at the front matter.
+            if len(self._maxima) > 1:
+                self._maxima.pop()
+            if len(self._minima) > 1:
+                self._minima.pop()
+
+        if self._bounded:
+            self._values.append((index, timestamp, value))
+            if self._sorted is not None:
+                insort(self._sorted, value)
+            self._evict(timestamp)
+        else:
+            self._sketch.push(value)
+
+    def extend(self, values, timestamps=None):
+        """Add a batch of values, with their timestamps when a time window is used."""
+        if timestamps is None:
+            for value in values:
+                self.push(value)
+        else:
+            for value, timestamp in zip(values, timestamps):
+                self.push(value, timestamp)
+
+    @property
+    def mean(self):
+        """The mean of the window, or None if it is empty."""
+        return self._mean if self._count else None
+
+    @property
+    def variance(self):
+        """The population variance of the window, or None if it is empty."""
+        return max(self._m2, 0.0) / self._count if self._count else None
+
+    @property
+    def stdev(self):
+        """The population standard deviation of the window, or None if it is empty."""
+        return math.sqrt(self.variance) if self._count else None
+
+    @property
+    def max(self):
+        """The largest value in the window, or None if it is empty."""
+        return self._maxima[0][1] if self._count else None
+
+    @property
+    def min(self):
+        """The smallest value in the window, or None if it is empty."""
+        return self._minima[0][1] if self._count else None
+
+    @property
+    def ewma(self):
+        """The exponentially weighted moving average of every pushed value, or None."""
+        return self._ewma
+
+    def quantile(self, q):
+        """
+        Return the q-quantile of the window: exact (nearest rank) when the window is bounded,
+        approximate from the sketch otherwise. Without ``exact_quantiles`` a bounded window
+        is sorted on each call, O(window log window).
+
+        Raises:
+            ValueError: If ``q`` is not between 0 and 1 or the window is empty.
+        """
+        if not self._bounded:
+            return self._sketch.quantile(q)
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        if not self._count:
+            raise ValueError("quantile of an empty window")
+        ordered = self._sorted
+        if ordered is None:
+            ordered = sorted(value for _, _, value in self._values)
+        return ordered[max(math.ceil(q * self._count) - 1, 0)]
+
+
+def main():
+    """
+    Main function to demonstrate rolling statistics over a short price series.
+    """
+    prices = [101.0, 102.5, 101.8, 103.2, 104.0, 103.1, 102.7, 105.4]
+    stats = RollingStatistics(window=4, alpha=0.5)
+    for price in prices:
+        stats.push(price)
+        print(
+            f"price={price:6.1f} max={stats.max:6.1f} min={stats.min:6.1f} "
+            f"mean={stats.mean:8.3f} stdev={stats.stdev:6.3f} ewma={stats.ewma:8.3f} "
+            f"median={stats.quantile(0.5):6.1f}"
+        )
+    timed = RollingStatistics(time_window=10)
+    timed.extend([1, 5, 3, 8], timestamps=[0, 4, 9, 12])
+    print("Values from the last 10 seconds:", len(timed), "max:", timed.max)
+
+
+if __name__ == "__main__":
+    main()
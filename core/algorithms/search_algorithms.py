@@ -1,3 +1,18 @@
+import operator
+from array import array
+from bisect import bisect_left, bisect_right, insort_right
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+NOT_FOUND = -1
+
+
 def linear_search(item, items):
     """
     Performs a linear search to find the index of an item in a list.
@@ -14,17 +29,287 @@ def linear_search(item, items):
     return None  # Item not found
 
 
+def linear_search_stream(item, iterable):
+    """
+    Performs a linear search over any iterable, consuming it lazily.
+    Nothing is materialized and iteration stops at the first match, so generators and
+    line iterators over large files can be searched; the scan itself runs in C.
+    Args:
+        item (any): The item to search for.
+        iterable (iterable): The values to scan.
+
+    Returns:
+        int or None: The position of the first match if found, None otherwise.
+    """
+    try:
+        return operator.indexOf(iterable, item)
+    except ValueError:
+        return None
+
+
+class SearchIndex:
+    """
+    A list of hashable values with a value -> positions map, for repeated lookups on unsorted data.
+    The map is built in one pass; afterwards ``find`` returns the same index as ``linear_search``
+    in O(1) and ``append``, ``pop`` and item assignment keep the map up to date without a rebuild.
+    """
+
+    def __init__(self, items=None, compact=False):
+        """
+        Args:
+            items (iterable, optional): The initial values.
+            compact (bool, optional): Store positions in ``array('q')`` instead of lists, which
+            uses 8 bytes per position rather than a pointer to an int object.
+        """
+        self._compact = compact
+        self._items = []
+        self._positions = {}
+        if items is not None:
+            for item in items:
+                self.append(item)
+
+    def _new_positions(self):
+        return array("q") if self._compact else []
+
+    def _add_position(self, item, index):
+        positions = self._positions.get(item)
+        if positions is None:
+            positions = self._positions[item] = self._new_positions()
+        if not positions or positions[-1] < index:
+            positions.append(index)
+        else:
+            positions.insert(bisect_left(positions, index), index)
+
+    def _remove_position(self, item, index):
+        positions = self._positions[item]
+        del positions[bisect_left(positions, index)]
+        if not positions:
+            del self._positions[item]
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __setitem__(self, index, item):
+        if index < 0:
+            index += len(self._items)
+        self._remove_position(self._items[index], index)
+        self._items[index] = item
+        self._add_position(item, index)
+
+    def __contains__(self, item):
+        return item in self._positions
+
+    def append(self, item):
+        """Append item to the end of the list."""
+        self._items.append(item)
+        self._add_position(item, len(self._items) - 1)
+
+    def pop(self, index=-1):
+        """
+        Remove and return the item at index (the last item by default).
+        Popping the last item is O(1); popping elsewhere shifts every later position, O(n).
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        size = len(self._items)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("pop index out of range")
+        item = self._items[index]
+        self._remove_position(item, index)
+        del self._items[index]
+        if index < len(self._items):
+            for positions in self._positions.values():
+                start = bisect_left(positions, index)
+                for slot in range(start, len(positions)):
+                    positions[slot] -= 1
+        return item
+
+    def find(self, item):
+        """Return the index of the first occurrence of item, or None, like ``linear_search``."""
+        positions = self._positions.get(item)
+        return positions[0] if positions else None
+
+    def find_all(self, item):
+        """Return the indices of every occurrence of item, in increasing order."""
+        return list(self._positions.get(item, ()))
+
+    def count(self, item):
+        """Return the number of occurrences of item."""
+        return len(self._positions.get(item, ()))
+
+
+class EytzingerIndex:
+    """
+    A read-only search structure that stores sorted keys in Eytzinger (breadth-first) order.
+    Slot 1 holds the root, and the children of slot k sit at 2k and 2k + 1, so the first levels
+    of every search touch the same few neighbouring slots and each step moves to a predictable
+    address instead of jumping across a sorted array. Keys are kept in a compact ``array`` when
+    they are all ints or all floats. Build it once, then query it many times.
+    """
+
+    def __init__(self, items):
+        """Build the index from any iterable of mutually comparable keys."""
+        ordered = sorted(items)
+        size = len(ordered)
+        self._size = size
+        slots = [None] * (size + 1)
+        ranks = array("q", [0]) * (size + 1)
+
+        # An in-order walk of the implicit tree visits the slots in sorted order.
+        rank, slot, stack = 0, 1, []
+        while stack or slot <= size:
+            if slot <= size:
+                stack.append(slot)
+                slot *= 2
+                continue
+            slot = stack.pop()
+            slots[slot] = ordered[rank]
+            ranks[slot] = rank
+            rank += 1
+            slot = 2 * slot + 1
+
+        if size and all(type(key) is int for key in ordered):
+            try:
+                self._keys = array("q", [0] + slots[1:])
+            except OverflowError:
+                self._keys = slots
+        elif size and all(type(key) is float for key in ordered):
+            self._keys = array("d", [0.0] + slots[1:])
+        else:
+            self._keys = slots
+        self._ranks = ranks
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, item):
+        return self.search(item) is not None
+
+    def _lower_bound_slot(self, item):
+        keys, size, slot = self._keys, self._size, 1
+        while slot <= size:
+            slot = 2 * slot + (keys[slot] < item)
+        # Undo the trailing right turns (and the last left turn) to reach the answer's slot.
+        return slot >> ((~slot) & (slot + 1)).bit_length()
+
+    def lower_bound(self, item):
+        """Return the sorted index of the first key not less than item (len(self) if none)."""
+        slot = self._lower_bound_slot(item)
+        return self._ranks[slot] if slot else self._size
+
+    def search(self, item):
+        """Return the sorted index of the first key equal to item, or None if it is absent."""
+        slot = self._lower_bound_slot(item)
+        if slot and self._keys[slot] == item:
+            return self._ranks[slot]
+        return None
+
+
 def _is_non_decreasing(items):
     """Return True when items are sorted in non-decreasing order."""
     return all(items[index] <= items[index + 1] for index in range(len(items) - 1))
 
 
+class SortedArray:
+    """
+    A list that is kept in non-decreasing order, so lookups never need to re-check sortedness.
+    Order is established once at construction; afterwards ``insert`` and ``remove`` preserve it
+    and every lookup is an O(log n) bisection.
+    """
+
+    def __init__(self, items=None):
+        """Build the array from any iterable of mutually comparable items, sorting a copy."""
+        self._items = sorted(items) if items is not None else []
+
+    @classmethod
+    def from_sorted(cls, items):
+        """
+        Wrap items that are already sorted, verifying their order once in O(n).
+
+        Raises:
+            ValueError: If ``items`` is not sorted in non-decreasing order.
+        """
+        items = list(items)
+        if not _is_non_decreasing(items):
+            raise ValueError("SortedArray.from_sorted requires items in non-decreasing order")
+        sorted_array = cls()
+        sorted_array._items = items
+        return sorted_array
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __contains__(self, item):
+        index = bisect_left(self._items, item)
+        return index < len(self._items) and self._items[index] == item
+
+    def __repr__(self):
+        return f"SortedArray({self._items!r})"
+
+    def insert(self, item):
+        """Insert item after any equal items already present."""
+        insort_right(self._items, item)
+
+    def remove(self, item):
+        """
+        Remove the first occurrence of item.
+
+        Raises:
+            ValueError: If ``item`` is not present.
+        """
+        del self._items[self.index(item)]
+
+    def bisect_left(self, item):
+        """Return the first position at which item could be inserted keeping the order."""
+        return bisect_left(self._items, item)
+
+    def bisect_right(self, item):
+        """Return the last position at which item could be inserted keeping the order."""
+        return bisect_right(self._items, item)
+
+    def index(self, item):
+        """
+        Return the position of the first occurrence of item.
+
+        Raises:
+            ValueError: If ``item`` is not present.
+        """
+        index = bisect_left(self._items, item)
+        if index < len(self._items) and self._items[index] == item:
+            return index
+        raise ValueError(f"{item!r} is not in SortedArray")
+
+    def count(self, item):
+        """Return the number of occurrences of item."""
+        return bisect_right(self._items, item) - bisect_left(self._items, item)
+
+    def range(self, lo, hi):
+        """Return the items x with lo <= x < hi, in order."""
+        return self._items[bisect_left(self._items, lo) : bisect_left(self._items, hi)]
+
+
 def binary_search(item, items):
     """
     Performs a binary search to find the index of an item in a sorted list.
     Args:
         item (any): The item to search for.
-        items (list): The sorted list in which to search the item.
+        items (list or SortedArray): The sorted list in which to search the item. A
+        ``SortedArray`` is trusted to be sorted, so no O(n) order check is made.
 
     Returns:
         int or None: The index of the item if found, None otherwise.
@@ -32,7 +317,7 @@ def binary_search(item, items):
     Raises:
         ValueError: If ``items`` is not sorted in non-decreasing order.
     """
-    if not _is_non_decreasing(items):
+    if not isinstance(items, SortedArray) and not _is_non_decreasing(items):
         raise ValueError("binary_search requires a sorted list in non-decreasing order")
 
     first, last = 0, len(items) - 1
@@ -47,6 +332,175 @@ def binary_search(item, items):
     return None  # Item not found
 
 
+def interpolation_search(item, items):
+    """
+    Performs an interpolation search to find the index of an item in a sorted list of numbers.
+    Each probe is placed where the item would sit if the values were evenly spread between the
+    current bounds, which takes about O(log log n) probes on uniformly distributed data. When a
+    probe fails to halve the remaining range, the next probe is a plain bisection, so skewed data
+    still needs at most about 2 log2(n) probes.
+    Args:
+        item (int or float): The number to search for.
+        items (list or SortedArray): The sorted numbers in which to search the item.
+
+    Returns:
+        int or None: The index of the item if found, None otherwise.
+
+    Raises:
+        ValueError: If ``items`` is not sorted in non-decreasing order.
+    """
+    if not isinstance(items, SortedArray) and not _is_non_decreasing(items):
+        raise ValueError("interpolation_search requires a sorted list in non-decreasing order")
+    if not items:
+        return None
+
+    low, high = 0, len(items) - 1
+    low_value, high_value = items[low], items[high]
+    if item == low_value:
+        return low
+    if item == high_value:
+        return high
+    if item < low_value or high_value < item:
+        return None
+
+    # Invariant: items[low] < item < items[high], so the item can only be strictly inside.
+    bisect_next = False
+    while high - low > 1:
+        if bisect_next:
+            mid = (low + high) // 2
+        else:
+            try:
+                offset = int((item - low_value) * (high - low) // (high_value - low_value))
+            except (ValueError, OverflowError):
+                # Infinite or overflowing float bounds give no usable estimate: bisect instead.
+                offset = (high - low) // 2
+            mid = min(max(low + offset, low + 1), high - 1)
+        value = items[mid]
+        if value == item:
+            return mid
+        previous = high - low
+        if value < item:
+            low, low_value = mid, value
+        else:
+            high, high_value = mid, value
+        bisect_next = not bisect_next and high - low > previous // 2
+    return None
+
+
+def exponential_search(item, items):
+    """
+    Performs an exponential (galloping) search to find the index of an item in a sorted sequence.
+    Positions 1, 2, 4, 8, ... are probed until one holds a value not less than the item, then the
+    last gap is bisected. It costs O(log i) probes for an item at index i, so hits near the front
+    are cheap, and it never needs the length: an ``IndexError`` is treated as the end of the data.
+    That makes it suitable for lazily loaded or unbounded sequences. Order is not verified.
+    Args:
+        item (any): The item to search for.
+        items (sequence): A sorted object supporting integer indexing.
+
+    Returns:
+        int or None: The index of the item if found, None otherwise.
+    """
+    try:
+        first = items[0]
+    except IndexError:
+        return None
+    if first == item:
+        return 0
+    if item < first:
+        return None
+
+    bound = 1
+    while True:
+        try:
+            value = items[bound]
+        except IndexError:
+            break
+        if value == item:
+            return bound
+        if item < value:
+            break
+        bound *= 2
+
+    first, last = bound // 2 + 1, bound - 1
+    while first <= last:
+        mid = (first + last) // 2
+        try:
+            value = items[mid]
+        except IndexError:
+            last = mid - 1
+            continue
+        if value == item:
+            return mid
+        elif item > value:
+            first = mid + 1
+        else:
+            last = mid - 1
+    return None
+
+
+def _binary_search_many_numpy(keys, items):
+    """Vectorized binary_search_many for NumPy inputs."""
+    keys = np.asarray(keys)
+    items = np.asarray(items)
+    if items.size > 1 and not np.all(items[:-1] <= items[1:]):
+        raise ValueError("binary_search_many requires a sorted list in non-decreasing order")
+    if items.size == 0:
+        return np.full(keys.shape, NOT_FOUND, dtype=np.intp)
+    positions = np.searchsorted(items, keys, side="left")
+    clipped = np.minimum(positions, items.size - 1)
+    return np.where(items[clipped] == keys, positions, NOT_FOUND)
+
+
+def binary_search_many(keys, items):
+    """
+    Looks up many keys in the same sorted list in one call.
+    The order of ``items`` is checked once per batch rather than once per key. When the keys
+    are themselves sorted, each search resumes from the previous hit: dense batches walk both
+    sequences together like a merge in O(n + k), sparse batches bisect only the remaining
+    tail. NumPy inputs use a vectorized ``searchsorted``.
+    Args:
+        keys (iterable): The items to search for.
+        items (list, array.array, SortedArray or numpy.ndarray): The sorted sequence to search.
+
+    Returns:
+        array.array or numpy.ndarray: For each key, the index of its first occurrence in
+        ``items``, or ``NOT_FOUND`` (-1) when it is missing.
+
+    Raises:
+        ValueError: If ``items`` is not sorted in non-decreasing order.
+    """
+    if NUMPY_AVAILABLE and (isinstance(items, np.ndarray) or isinstance(keys, np.ndarray)):
+        return _binary_search_many_numpy(keys, items)
+
+    if isinstance(items, SortedArray):
+        items = items._items
+    elif not _is_non_decreasing(items):
+        raise ValueError("binary_search_many requires a sorted list in non-decreasing order")
+    if not isinstance(keys, (list, tuple, array)):
+        keys = list(keys)
+
+    size = len(items)
+    result = array("q", [NOT_FOUND]) * len(keys)
+    if _is_non_decreasing(keys):
+        position = 0
+        dense = size <= 4 * len(keys)
+        for index, key in enumerate(keys):
+            if dense:
+                while position < size and items[position] < key:
+                    position += 1
+            else:
+                position = bisect_left(items, key, position)
+            if position < size and items[position] == key:
+                result[index] = position
+    else:
+        for index, key in enumerate(keys):
+            position = bisect_left(items, key)
+            if position < size and items[position] == key:
+                result[index] = position
+    return result
+
+
 def main():
     """
     Main function to demonstrate the functionality of search algorithms with various test cases.
@@ -61,6 +515,24 @@ def main():
         print(
             f"Binary Search for {search_item}: Index = {binary_search(search_item, test_items)}"
         )
+        print(
+            f"Interpolation Search for {search_item}: "
+            f"Index = {interpolation_search(search_item, test_items)}"
+        )
+        print(
+            f"Exponential Search for {search_item}: "
+            f"Index = {exponential_search(search_item, test_items)}"
+        )
+
+    table = SortedArray.from_sorted(test_items)
+    table.insert(35)
+    print(f"SortedArray range [30, 50): {table.range(30, 50)}")
+
+    static_table = EytzingerIndex(test_items)
+    print(f"EytzingerIndex position of 70: {static_table.search(70)}")
+
+    index = SearchIndex([30, 10, 30, 20])
+    print(f"SearchIndex positions of 30: {index.find_all(30)}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,160 @@
+import heapq
+
+from .sorting_algorithms_recursion import (
+    _INSERTION_SORT_THRESHOLD,
+    _binary_insertion_sort,
+    _choose_pivot,
+    _partition_three_way,
+    _sort_by_key,
+    quick_sort,
+)
+
+
+def _median_of_medians(dataset, lo, hi):
+    """Return a pivot value for dataset[lo:hi] that is guaranteed to lie near the middle."""
+    medians = []
+    for start in range(lo, hi, 5):
+        group = sorted(dataset[start : min(start + 5, hi)])
+        medians.append(group[len(group) // 2])
+    middle = len(medians) // 2
+    _select(medians, 0, len(medians), middle, 0)
+    return medians[middle]
+
+
+def _select(dataset, lo, hi, n, depth_limit):
+    """
+    Rearrange dataset[lo:hi] so that position n holds the value it would have if sorted.
+    Pivots come from median-of-three/ninther sampling until depth_limit partitions have been
+    spent, after which median-of-medians pivots guarantee linear time.
+    """
+    while hi - lo > _INSERTION_SORT_THRESHOLD:
+        if depth_limit > 0:
+            depth_limit -= 1
+            pivot = _choose_pivot(dataset, lo, hi)
+        else:
+            pivot = _median_of_medians(dataset, lo, hi)
+        lt, gt = _partition_three_way(dataset, lo, hi, pivot)
+        if n < lt:
+            hi = lt
+        elif n >= gt:
+            lo = gt
+        else:
+            return
+    _binary_insertion_sort(dataset, lo, hi, lo + 1)
+
+
+def _sort_leading(dataset, k):
+    """Move the k smallest elements of dataset to the front, in sorted order."""
+    size = len(dataset)
+    if k < size:
+        _select(dataset, 0, size, k - 1, 2 * size.bit_length())
+    quick_sort(dataset, 0, k - 1)
+
+
+def _sort_trailing(dataset, k):
+    """Move the k largest elements of dataset to the back, in sorted order."""
+    size = len(dataset)
+    if k < size:
+        _select(dataset, 0, size, size - k, 2 * size.bit_length())
+    quick_sort(dataset, size - k, size - 1)
+
+
+def nth_element(dataset, n, key=None, reverse=False):
+    """
+    Partially sorts a list so that ``dataset[n]`` holds the element that would be there if the
+    list were fully sorted, everything before it is not greater and everything after it is not
+    smaller. Uses introselect: quickselect with sampled pivots and a median-of-medians fallback,
+    which runs in O(n) time even on adversarial input.
+    Args:
+        dataset (list): The list to be rearranged.
+        n (int): The position to select. Negative values count from the end.
+        key (callable, optional): Function computing the sort key of each element.
+        reverse (bool, optional): Select as if the list were sorted in descending order.
+
+    Returns:
+        list: The rearranged list.
+
+    Raises:
+        IndexError: If ``n`` is out of range.
+    """
+    size = len(dataset)
+    if n < 0:
+        n += size
+    if not 0 <= n < size:
+        raise IndexError("nth_element index out of range")
+    if key is not None or reverse:
+        # Decorated items are selected in ascending order and reversed afterwards.
+        target = size - 1 - n if reverse else n
+        return _sort_by_key(
+            dataset,
+            key,
+            reverse,
+            lambda items: _select(items, 0, size, target, 2 * size.bit_length()),
+        )
+    _select(dataset, 0, size, n, 2 * size.bit_length())
+    return dataset
+
+
+def partial_sort(dataset, k, key=None, reverse=False):
+    """
+    Rearranges a list so that its first ``k`` positions hold the ``k`` smallest elements in
+    sorted order; the order of the remaining elements is unspecified. Runs in O(n + k log k).
+    Args:
+        dataset (list): The list to be rearranged.
+        k (int): How many leading elements to sort.
+        key (callable, optional): Function computing the sort key of each element.
+        reverse (bool, optional): Place the ``k`` largest elements first, in descending order.
+
+    Returns:
+        list: The rearranged list.
+    """
+    size = len(dataset)
+    k = min(k, size)
+    if k <= 0:
+        return dataset
+    if key is not None or reverse:
+        # Decorated items are arranged in ascending order and reversed afterwards.
+        arrange = _sort_trailing if reverse else _sort_leading
+        return _sort_by_key(dataset, key, reverse, lambda items: arrange(items, k))
+    _sort_leading(dataset, k)
+    return dataset
+
+
+def top_k(iterable, k, key=None):
+    """
+    Returns the ``k`` largest items of any iterable, largest first, in O(n log k) time.
+    The input is consumed lazily and only a bounded heap of ``k`` items is kept, so it
+    works on generators and file streams of any length. Among equal keys, earlier items win.
+    Args:
+        iterable (iterable): The items to scan.
+        k (int): How many items to keep.
+        key (callable, optional): Function computing the ranking key of each item.
+
+    Returns:
+        list: Up to ``k`` items in descending key order.
+    """
+    if k <= 0:
+        return []
+    heap = []
+    for index, item in enumerate(iterable):
+        value = item if key is None else key(item)
+        if len(heap) < k:
+            heapq.heappush(heap, (value, -index, item))
+        elif heap[0][0] < value:
+            heapq.heapreplace(heap, (value, -index, item))
+    return [entry[2] for entry in sorted(heap, reverse=True)]
+
+
+def main():
+    """
+    Main function to demonstrate the selection algorithms.
+    """
+    dataset = [3, 6, 8, 10, 1, 2, 1, 9, 5, 7]
+    middle = len(dataset) // 2
+    print("Median:", nth_element(dataset.copy(), middle)[middle])
+    print("Three smallest:", partial_sort(dataset.copy(), 3)[:3])
+    print("Top three:", top_k(iter(dataset), 3))
+
+
+if __name__ == "__main__":
+    main()
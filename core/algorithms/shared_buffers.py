@@ -0,0 +1,79 @@
+from array import array
+from contextlib import contextmanager
+from multiprocessing.shared_memory import SharedMemory
+
+# Element formats that map one-to-one onto array.array typecodes.
+SUPPORTED_TYPECODES = frozenset("bBhHiIlLqQfd")
+
+
+def buffer_typecode(data):
+    """
+    Returns the typecode of a numeric buffer that can be copied into shared memory as is.
+    Args:
+        data (any): An ``array.array``, NumPy array or other buffer-protocol object.
+
+    Returns:
+        str or None: The typecode, or None if ``data`` is not a buffer or is not C-contiguous
+        with a supported element format.
+
+    Raises:
+        ValueError: If ``data`` is a multi-dimensional buffer.
+    """
+    try:
+        view = memoryview(data)
+    except TypeError:
+        return None
+    with view:
+        if view.ndim != 1:
+            raise ValueError("a one-dimensional buffer is required")
+        if view.format in SUPPORTED_TYPECODES and view.c_contiguous:
+            return view.format
+    return None
+
+
+def split_range(length, parts):
+    """Split range(length) into at most parts contiguous, non-empty (lo, hi) chunks."""
+    bounds = [(length * k // parts, length * (k + 1) // parts) for k in range(parts)]
+    return [(lo, hi) for lo, hi in bounds if lo < hi]
+
+
+@contextmanager
+def shared_block(size):
+    """Yield a new SharedMemory block of at least size bytes, unlinked on exit."""
+    shm = SharedMemory(create=True, size=max(size, 1))
+    try:
+        yield shm
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+@contextmanager
+def shared_copy(data):
+    """Yield a new SharedMemory block holding a copy of the bytes of the buffer data."""
+    with memoryview(data) as view, view.cast("B") as payload:
+        with shared_block(payload.nbytes) as shm:
+            shm.buf[: payload.nbytes] = payload
+            yield shm
+
+
+def read_chunk(name, typecode, lo, hi):
+    """Worker side: return items lo..hi of the named shared block as an array."""
+    shm = SharedMemory(name=name)
+    try:
+        itemsize = array(typecode).itemsize
+        chunk = array(typecode)
+        chunk.frombytes(shm.buf[lo * itemsize : hi * itemsize])
+        return chunk
+    finally:
+        shm.close()
+
+
+def write_chunk(name, chunk, lo):
+    """Worker side: write the array chunk into the named shared block starting at item lo."""
+    shm = SharedMemory(name=name)
+    try:
+        start = lo * chunk.itemsize
+        shm.buf[start : start + len(chunk) * chunk.itemsize] = chunk.tobytes()
+    finally:
+        shm.close()
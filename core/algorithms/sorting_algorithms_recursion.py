@@ -1,12 +1,38 @@
-def bubble_sort(dataset):
+def _sort_by_key(dataset, key, reverse, sort, lo=0, hi=None):
+    """
+    Decorate-sort-undecorate dataset[lo:hi] in place: every key is computed once, the
+    (key, index, value) triples are ordered with sort and the values are written back.
+    The index breaks ties, so equal keys keep their original order even when reversed.
+    """
+    if hi is None:
+        hi = len(dataset)
+    sign = -1 if reverse else 1
+    decorated = [
+        (dataset[index] if key is None else key(dataset[index]), sign * index, dataset[index])
+        for index in range(lo, hi)
+    ]
+    sort(decorated)
+    if reverse:
+        decorated.reverse()
+    dataset[lo:hi] = [item[2] for item in decorated]
+    return dataset
+
+
+def bubble_sort(dataset, key=None, reverse=False):
     """
     Sorts a list using the bubble sort algorithm.
     Args:
         dataset (list): The list to be sorted.
+        key (callable, optional): Function computing the sort key of each element. It is
+        called exactly once per element.
+        reverse (bool, optional): Sort in descending order while keeping equal keys in
+        their original order.
 
     Returns:
         list: The sorted list.
     """
+    if key is not None or reverse:
+        return _sort_by_key(dataset, key, reverse, bubble_sort)
     n = len(dataset)
     for i in range(n - 1):
         for j in range(0, n - i - 1):
@@ -15,15 +41,21 @@ def bubble_sort(dataset):
     return dataset
 
 
-def merge_sort(dataset):
+def merge_sort(dataset, key=None, reverse=False):
     """
     Sorts a list using the merge sort algorithm with recursion.
     Args:
         dataset (list): The list to be sorted.
+        key (callable, optional): Function computing the sort key of each element. It is
+        called exactly once per element.
+        reverse (bool, optional): Sort in descending order while keeping equal keys in
+        their original order.
 
     Returns:
         list: The sorted list.
     """
+    if key is not None or reverse:
+        return _sort_by_key(dataset, key, reverse, merge_sort)
     if len(dataset) > 1:
         mid = len(dataset) // 2
         left_half = dataset[:mid]
@@ -57,33 +89,383 @@ def merge_sort(dataset):
     return dataset
 
 
-def quick_sort(dataset, first, last):
+def bottom_up_merge_sort(dataset, buffer=None, key=None, reverse=False):
     """
-    Sorts a list using the quick sort algorithm with recursion.
+    Sorts a list using an iterative, bottom-up merge sort.
+    Runs of width 1, 2, 4, ... are merged back and forth between the list and a single
+    auxiliary buffer, so no slices are created and no recursion is needed. The sort is stable.
     Args:
         dataset (list): The list to be sorted.
-        first (int): The first index of the segment to be sorted.
-        last (int): The last index of the segment to be sorted.
+        buffer (list, optional): Scratch space with at least ``len(dataset)`` slots. Passing the
+        same buffer to repeated calls avoids allocating a new one each time. Its contents are
+        overwritten.
+        key (callable, optional): Function computing the sort key of each element. It is
+        called exactly once per element.
+        reverse (bool, optional): Sort in descending order while keeping equal keys in
+        their original order.
 
     Returns:
         list: The sorted list.
+
+    Raises:
+        ValueError: If ``buffer`` is shorter than ``dataset``.
     """
+    if key is not None or reverse:
+        return _sort_by_key(
+            dataset, key, reverse, lambda items: bottom_up_merge_sort(items, buffer)
+        )
+    n = len(dataset)
+    if n < 2:
+        return dataset
+    if buffer is None:
+        buffer = [None] * n
+    elif len(buffer) < n:
+        raise ValueError("buffer must have at least as many slots as dataset")
+
+    # Each pass moves the data to the other list. When the number of passes is odd,
+    # sort adjacent pairs in place first so the final pass lands back in dataset.
+    width = 1
+    if ((n - 1).bit_length()) % 2 == 1:
+        for i in range(0, n - 1, 2):
+            if dataset[i + 1] < dataset[i]:
+                dataset[i], dataset[i + 1] = dataset[i + 1], dataset[i]
+        width = 2
 
-    def partition(low, high):
-        pivot = dataset[high]
-        i = low - 1
-        for j in range(low, high):
-            if dataset[j] <= pivot:
+    source, target = dataset, buffer
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            i, j, k = lo, mid, lo
+            while i < mid and j < hi:
+                if source[j] < source[i]:
+                    target[k] = source[j]
+                    j += 1
+                else:
+                    target[k] = source[i]
+                    i += 1
+                k += 1
+            while i < mid:
+                target[k] = source[i]
                 i += 1
-                dataset[i], dataset[j] = dataset[j], dataset[i]
-        dataset[i + 1], dataset[high] = dataset[high], dataset[i + 1]
-        return i + 1
+                k += 1
+            while j < hi:
+                target[k] = source[j]
+                j += 1
+                k += 1
+        source, target = target, source
+        width *= 2
+
+    return dataset
+
+
+_INSERTION_SORT_THRESHOLD = 16
+_NINTHER_THRESHOLD = 40
+
+
+def _median_of_three(dataset, a, b, c):
+    """Return whichever of the indices a, b, c holds the median value."""
+    x, y, z = dataset[a], dataset[b], dataset[c]
+    if x < y:
+        if y < z:
+            return b
+        return c if x < z else a
+    if x < z:
+        return a
+    return c if y < z else b
+
+
+def _choose_pivot(dataset, lo, hi):
+    """Return a pivot value for dataset[lo:hi] using median-of-three or Tukey's ninther."""
+    size = hi - lo
+    mid = lo + size // 2
+    if size < _NINTHER_THRESHOLD:
+        return dataset[_median_of_three(dataset, lo, mid, hi - 1)]
+    step = size // 8
+    first = _median_of_three(dataset, lo, lo + step, lo + 2 * step)
+    middle = _median_of_three(dataset, mid - step, mid, mid + step)
+    last = _median_of_three(dataset, hi - 1 - 2 * step, hi - 1 - step, hi - 1)
+    return dataset[_median_of_three(dataset, first, middle, last)]
+
+
+def _partition_three_way(dataset, lo, hi, pivot):
+    """
+    Dutch national flag partition of dataset[lo:hi] around pivot.
+    Returns (lt, gt) such that dataset[lo:lt] < pivot, dataset[lt:gt] == pivot
+    and dataset[gt:hi] > pivot.
+    """
+    lt, i, gt = lo, lo, hi
+    while i < gt:
+        value = dataset[i]
+        if value < pivot:
+            dataset[lt], dataset[i] = value, dataset[lt]
+            lt += 1
+            i += 1
+        elif pivot < value:
+            gt -= 1
+            dataset[gt], dataset[i] = value, dataset[gt]
+        else:
+            i += 1
+    return lt, gt
+
+
+def _sift_down(dataset, offset, root, size):
+    """Restore the max-heap property for the heap stored in dataset[offset:offset + size]."""
+    while True:
+        child = 2 * root + 1
+        if child >= size:
+            return
+        if child + 1 < size and dataset[offset + child] < dataset[offset + child + 1]:
+            child += 1
+        if dataset[offset + root] < dataset[offset + child]:
+            dataset[offset + root], dataset[offset + child] = (
+                dataset[offset + child],
+                dataset[offset + root],
+            )
+            root = child
+        else:
+            return
+
+
+def _heap_sort(dataset, lo, hi):
+    """Sort dataset[lo:hi] in place with heapsort."""
+    size = hi - lo
+    for root in range(size // 2 - 1, -1, -1):
+        _sift_down(dataset, lo, root, size)
+    for end in range(size - 1, 0, -1):
+        dataset[lo], dataset[lo + end] = dataset[lo + end], dataset[lo]
+        _sift_down(dataset, lo, 0, end)
+
+
+def _introsort(dataset, lo, hi, depth_limit):
+    """Sort dataset[lo:hi], recursing on the smaller partition and looping on the larger."""
+    while hi - lo > _INSERTION_SORT_THRESHOLD:
+        if depth_limit == 0:
+            _heap_sort(dataset, lo, hi)
+            return
+        depth_limit -= 1
+        pivot = _choose_pivot(dataset, lo, hi)
+        lt, gt = _partition_three_way(dataset, lo, hi, pivot)
+        if lt - lo < hi - gt:
+            _introsort(dataset, lo, lt, depth_limit)
+            lo = gt
+        else:
+            _introsort(dataset, gt, hi, depth_limit)
+            hi = lt
+    _binary_insertion_sort(dataset, lo, hi, lo + 1)
+
+
+def quick_sort(dataset, first, last, key=None, reverse=False):
+    """
+    Sorts a list segment using introsort, a quick sort with a guaranteed worst case.
+    Pivots are chosen with median-of-three (or Tukey's ninther on large segments) and
+    partitioning is three-way, so runs of equal values are not revisited. Only the smaller
+    partition is handled recursively, keeping the stack depth at O(log n), and segments that
+    exceed a 2*log2(n) depth limit are finished with heapsort, bounding the work at O(n log n).
+    Args:
+        dataset (list): The list to be sorted.
+        first (int): The first index of the segment to be sorted.
+        last (int): The last index of the segment to be sorted.
+        key (callable, optional): Function computing the sort key of each element. It is
+        called exactly once per element.
+        reverse (bool, optional): Sort in descending order while keeping equal keys in
+        their original order.
 
+    Returns:
+        list: The sorted list.
+    """
+    if first < last and (key is not None or reverse):
+        return _sort_by_key(
+            dataset,
+            key,
+            reverse,
+            lambda items: quick_sort(items, 0, len(items) - 1),
+            first,
+            last + 1,
+        )
     if first < last:
-        pi = partition(first, last)
-        quick_sort(dataset, first, pi - 1)
-        quick_sort(dataset, pi + 1, last)
+        depth_limit = 2 * (last - first + 1).bit_length()
+        _introsort(dataset, first, last + 1, depth_limit)
+    return dataset
+
+
+_MIN_MERGE = 32
+_MIN_GALLOP = 7
+
+
+def _min_run_length(n):
+    """Return the minimum run length used by adaptive_sort for a list of size n."""
+    carry = 0
+    while n >= _MIN_MERGE:
+        carry |= n & 1
+        n >>= 1
+    return n + carry
+
+
+def _count_run_and_make_ascending(dataset, lo, hi):
+    """Return the length of the run starting at lo, reversing a strictly descending run in place."""
+    run_hi = lo + 1
+    if run_hi == hi:
+        return 1
+    if dataset[run_hi] < dataset[lo]:
+        run_hi += 1
+        while run_hi < hi and dataset[run_hi] < dataset[run_hi - 1]:
+            run_hi += 1
+        dataset[lo:run_hi] = dataset[lo:run_hi][::-1]
+    else:
+        run_hi += 1
+        while run_hi < hi and not dataset[run_hi] < dataset[run_hi - 1]:
+            run_hi += 1
+    return run_hi - lo
+
+
+def _binary_insertion_sort(dataset, lo, hi, start):
+    """Extend the sorted prefix dataset[lo:start] to cover dataset[lo:hi]."""
+    for i in range(start, hi):
+        pivot = dataset[i]
+        left, right = lo, i
+        while left < right:
+            mid = (left + right) // 2
+            if pivot < dataset[mid]:
+                right = mid
+            else:
+                left = mid + 1
+        dataset[left + 1 : i + 1] = dataset[left:i]
+        dataset[left] = pivot
+
+
+def _gallop_left(key, items, lo, hi):
+    """Return the first index in items[lo:hi] whose value is not less than key."""
+    last, offset = lo, 1
+    while lo + offset - 1 < hi and items[lo + offset - 1] < key:
+        last = lo + offset
+        offset <<= 1
+    high = min(lo + offset - 1, hi)
+    while last < high:
+        mid = (last + high) // 2
+        if items[mid] < key:
+            last = mid + 1
+        else:
+            high = mid
+    return last
+
+
+def _gallop_right(key, items, lo, hi):
+    """Return the first index in items[lo:hi] whose value is greater than key."""
+    last, offset = lo, 1
+    while lo + offset - 1 < hi and not key < items[lo + offset - 1]:
+        last = lo + offset
+        offset <<= 1
+    high = min(lo + offset - 1, hi)
+    while last < high:
+        mid = (last + high) // 2
+        if key < items[mid]:
+            high = mid
+        else:
+            last = mid + 1
+    return last
+
+
+def _merge_runs(dataset, lo, mid, hi):
+    """Merge the adjacent ascending runs dataset[lo:mid] and dataset[mid:hi] with galloping."""
+    # Elements of the left run that already precede the right run stay where they are,
+    # and so do elements of the right run that already follow the left run.
+    start = _gallop_right(dataset[mid], dataset, lo, mid)
+    if start == mid:
+        return
+    end = _gallop_left(dataset[mid - 1], dataset, mid, hi)
+
+    left = dataset[start:mid]
+    left_len = len(left)
+    i, j, k = 0, mid, start
+    left_wins = right_wins = 0
+    while i < left_len and j < end:
+        if left_wins >= _MIN_GALLOP:
+            count = _gallop_right(dataset[j], left, i, left_len) - i
+            dataset[k : k + count] = left[i : i + count]
+            i += count
+            k += count
+            left_wins = 0
+        elif right_wins >= _MIN_GALLOP:
+            count = _gallop_left(left[i], dataset, j, end) - j
+            dataset[k : k + count] = dataset[j : j + count]
+            j += count
+            k += count
+            right_wins = 0
+        elif dataset[j] < left[i]:
+            dataset[k] = dataset[j]
+            j += 1
+            k += 1
+            right_wins += 1
+            left_wins = 0
+        else:
+            dataset[k] = left[i]
+            i += 1
+            k += 1
+            left_wins += 1
+            right_wins = 0
+
+    # Whatever is left of the right run is already in its final position.
+    dataset[k : k + left_len - i] = left[i:]
+
+
+def _collapse_runs(dataset, runs, force=False):
+    """Merge pending runs until the run-length invariants hold (or a single run remains)."""
+    while len(runs) > 1:
+        n = len(runs) - 2
+        if force:
+            if n > 0 and runs[n - 1][1] < runs[n + 1][1]:
+                n -= 1
+        elif (n > 0 and runs[n - 1][1] <= runs[n][1] + runs[n + 1][1]) or (
+            n > 1 and runs[n - 2][1] <= runs[n - 1][1] + runs[n][1]
+        ):
+            if runs[n - 1][1] < runs[n + 1][1]:
+                n -= 1
+        elif runs[n][1] > runs[n + 1][1]:
+            break
+
+        base, length = runs[n]
+        next_length = runs[n + 1][1]
+        _merge_runs(dataset, base, base + length, base + length + next_length)
+        runs[n] = [base, length + next_length]
+        del runs[n + 1]
+
+
+def adaptive_sort(dataset, key=None, reverse=False):
+    """
+    Sorts a list using an adaptive, run-detecting merge sort (in the style of Timsort).
+    Existing ascending and strictly descending runs are reused, short runs are extended
+    with binary insertion sort, and runs are merged with galloping, so already-sorted and
+    nearly-sorted input is handled in close to linear time. The sort is stable.
+    Args:
+        dataset (list): The list to be sorted.
+        key (callable, optional): Function computing the sort key of each element. It is
+        called exactly once per element.
+        reverse (bool, optional): Sort in descending order while keeping equal keys in
+        their original order.
+
+    Returns:
+        list: The sorted list.
+    """
+    if key is not None or reverse:
+        return _sort_by_key(dataset, key, reverse, adaptive_sort)
+    n = len(dataset)
+    if n < 2:
+        return dataset
 
+    min_run = _min_run_length(n)
+    runs = []
+    lo = 0
+    while lo < n:
+        run_length = _count_run_and_make_ascending(dataset, lo, n)
+        if run_length < min_run:
+            forced = min(min_run, n - lo)
+            _binary_insertion_sort(dataset, lo, lo + forced, lo + run_length)
+            run_length = forced
+        runs.append([lo, run_length])
+        _collapse_runs(dataset, runs)
+        lo += run_length
+    _collapse_runs(dataset, runs, force=True)
     return dataset
 
 
@@ -96,6 +478,8 @@ def main():
     print("Bubble sorted:", bubble_sort(dataset.copy()))
     print("Merge sorted:", merge_sort(dataset.copy()))
     print("Quick sorted:", quick_sort(dataset.copy(), 0, len(dataset) - 1))
+    print("Bottom-up merge sorted:", bottom_up_merge_sort(dataset.copy()))
+    print("Adaptive sorted:", adaptive_sort(dataset.copy()))
 
 
 if __name__ == "__main__":
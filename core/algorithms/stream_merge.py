@@ -0,0 +1,74 @@
+import heapq
+
+_MISSING = object()
+
+
+class _ReverseKey:
+    """Wraps a key so that the heap orders it in descending order."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+
+def merge_sorted(*iterables, key=None, reverse=False, unique=False):
+    """
+    Lazily merges any number of already sorted iterables into one sorted stream.
+    Only the current head of every input is held in a heap, so memory is O(k) for k inputs and
+    each item costs O(log k) comparisons. Inputs may be lists, generators or open files; they
+    are consumed one item at a time. Equal items are yielded in the order of their inputs.
+    Args:
+        *iterables: The sorted inputs.
+        key (callable, optional): Function computing the sort key of each item. The inputs
+        must be sorted by this key.
+        reverse (bool, optional): The inputs are sorted in descending order.
+        unique (bool, optional): Yield only the first of consecutive items with equal keys.
+
+    Yields:
+        The merged items in sorted order.
+    """
+    heap = []
+    for order, iterable in enumerate(iterables):
+        iterator = iter(iterable)
+        for value in iterator:
+            sort_key = value if key is None else key(value)
+            heap.append([_ReverseKey(sort_key) if reverse else sort_key, order, value, iterator])
+            break
+    heapq.heapify(heap)
+
+    last_key = _MISSING
+    while heap:
+        entry = heap[0]
+        sort_key, _, value, iterator = entry
+        if not unique or last_key is _MISSING or sort_key != last_key:
+            last_key = sort_key
+            yield value
+        for value in iterator:
+            sort_key = value if key is None else key(value)
+            entry[0] = _ReverseKey(sort_key) if reverse else sort_key
+            entry[2] = value
+            heapq.heapreplace(heap, entry)
+            break
+        else:
+            heapq.heappop(heap)
+
+
+def main():
+    """
+    Main function to demonstrate merging sorted shards.
+    """
+    shards = [[1, 4, 7, 10], iter([2, 4, 8]), (value * 3 for value in range(4))]
+    print("Merged:", list(merge_sorted(*shards)))
+    print("Merged unique:", list(merge_sorted([1, 2, 2, 5], [2, 3, 5], unique=True)))
+    print("Merged descending:", list(merge_sorted([9, 5, 1], [8, 2], reverse=True)))
+
+
+if __name__ == "__main__":
+    main()
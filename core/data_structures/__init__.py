@@ -1,4 +1,9 @@
-from .binary_search_tree import BinarySearchTree, TreeNode as BinarySearchTreeNode
+from .binary_search_tree import (
+    AVLTree,
+    AVLTreeNode,
+    BinarySearchTree,
+    TreeNode as BinarySearchTreeNode,
+)
 from .binary_tree import BinaryTree, TreeNode
 from .deque_based_queue import Queue
 from .doubly_linked_list import DoublyLinkedList, Node as DoublyLinkedListNode
@@ -6,6 +11,8 @@ from .list_based_stack import Stack
 from .singly_linked_list import Node as SinglyLinkedListNode, SinglyLinkedList
 
 __all__ = [
+    "AVLTree",
+    "AVLTreeNode",
     "BinarySearchTree",
     "BinarySearchTreeNode",
     "BinaryTree",
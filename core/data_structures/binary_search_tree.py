@@ -1,3 +1,6 @@
+import math
+
+
 class TreeNode:
     def __init__(self, data):
         self.data = data
@@ -94,6 +97,178 @@ class BinarySearchTree:
         return res
 
 
+class AVLTreeNode(TreeNode):
+    def __init__(self, data):
+        super().__init__(data)
+        self.height = 1
+
+
+def _height(node):
+    return node.height if node is not None else 0
+
+
+class AVLTree(BinarySearchTree):
+    """
+    A self-balancing BinarySearchTree with the same insert/search/delete/traversal API.
+    Subtree heights differ by at most one everywhere, so the height stays below
+    1.44 * log2(n + 2) and every operation is O(log n), even for keys inserted in sorted order.
+    All operations are iterative, so no input size can hit the recursion limit.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def _update_height(self, node):
+        node.height = 1 + max(_height(node.left), _height(node.right))
+
+    def _rotate_right(self, node):
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        self._update_height(node)
+        self._update_height(pivot)
+        return pivot
+
+    def _rotate_left(self, node):
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        self._update_height(node)
+        self._update_height(pivot)
+        return pivot
+
+    def _rebalance(self, node):
+        self._update_height(node)
+        balance = _height(node.left) - _height(node.right)
+        if balance > 1:
+            if _height(node.left.left) < _height(node.left.right):
+                node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+        if balance < -1:
+            if _height(node.right.right) < _height(node.right.left):
+                node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
+        return node
+
+    def _rebalance_path(self, path):
+        # Walk back up from the changed node; once a subtree keeps its root and height,
+        # nothing above it can change.
+        for index in range(len(path) - 1, -1, -1):
+            node = path[index]
+            old_height = node.height
+            subtree = self._rebalance(node)
+            if index == 0:
+                self.root = subtree
+            elif path[index - 1].left is node:
+                path[index - 1].left = subtree
+            else:
+                path[index - 1].right = subtree
+            if subtree is node and node.height == old_height:
+                break
+
+    def insert(self, data):
+        path = []
+        node = self.root
+        while node is not None:
+            path.append(node)
+            node = node.left if data < node.data else node.right
+        new_node = AVLTreeNode(data)
+        if not path:
+            self.root = new_node
+        elif data < path[-1].data:
+            path[-1].left = new_node
+        else:
+            path[-1].right = new_node
+        self.size += 1
+        self._rebalance_path(path)
+
+    def search(self, data):
+        node = self.root
+        while node is not None:
+            if node.data == data:
+                return True
+            node = node.left if data < node.data else node.right
+        return False
+
+    def delete(self, data):
+        path = []
+        node = self.root
+        while node is not None and node.data != data:
+            path.append(node)
+            node = node.left if data < node.data else node.right
+        if node is None:
+            return
+        if node.left is not None and node.right is not None:
+            # Replace the value with its in-order successor and unlink the successor instead.
+            path.append(node)
+            successor = node.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            node.data = successor.data
+            node = successor
+        child = node.left if node.left is not None else node.right
+        if not path:
+            self.root = child
+        elif path[-1].left is node:
+            path[-1].left = child
+        else:
+            path[-1].right = child
+        self.size -= 1
+        self._rebalance_path(path)
+
+    def height(self):
+        return _height(self.root)
+
+    def height_stats(self):
+        # An AVL tree with n nodes is at most about 1.44 * log2(n + 2) - 0.328 high.
+        bound = math.floor(1.4405 * math.log2(self.size + 2) - 0.3277)
+        return {"size": self.size, "height": self.height(), "max_height": bound}
+
+    def inorder_traversal(self):
+        res = []
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            res.append(node.data)
+            node = node.right
+        return res
+
+    def preorder_traversal(self):
+        res = []
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            res.append(node.data)
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
+        return res
+
+    def postorder_traversal(self):
+        # Root-right-left preorder, reversed, is left-right-root postorder.
+        res = []
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            res.append(node.data)
+            if node.left is not None:
+                stack.append(node.left)
+            if node.right is not None:
+                stack.append(node.right)
+        res.reverse()
+        return res
+
+
 def main():
     bst = BinarySearchTree()
     bst.insert(5)
@@ -111,6 +286,11 @@ def main():
     bst.delete(7)
     print("Inorder traversal after deleting 7:", bst.inorder_traversal())
 
+    avl = AVLTree()
+    for key in range(1, 1024):
+        avl.insert(key)
+    print("AVL tree after 1023 sorted inserts:", avl.height_stats())
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,98 @@
+import json
+import random
+
+import pytest
+
+from apps.algorithms_lab.benchmark_suite import (
+    DISTRIBUTIONS,
+    FIBONACCI_CASES,
+    SEARCH_CASES,
+    SORT_CASES,
+    find_regressions,
+    main,
+    run_benchmarks,
+    run_fibonacci_benchmarks,
+    run_search_benchmarks,
+)
+
+
+def test_distributions_produce_requested_sizes():
+    for name, build in DISTRIBUTIONS.items():
+        data = build(101, random.Random(0))
+        assert len(data) == 101, name
+
+
+def test_run_benchmarks_records_time_memory_and_comparisons():
+    results = run_benchmarks(SORT_CASES, ["random", "sorted"], [50], repeat=1)
+
+    assert {record["algorithm"] for record in results} == set(SORT_CASES)
+    for record in results:
+        assert record["seconds"] >= 0
+        assert record["peak_bytes"] >= 0
+        if record["algorithm"] in ("numeric_sort", "parallel_sort"):
+            assert record["comparisons"] is None
+        else:
+            assert record["comparisons"] > 0
+
+
+def test_run_benchmarks_skips_sizes_above_case_limit():
+    results = run_benchmarks({"bubble_sort": SORT_CASES["bubble_sort"]}, ["random"], [5000], repeat=1)
+    assert results == []
+
+
+def test_find_regressions_applies_threshold_and_noise_floor():
+    baseline = [
+        {"algorithm": "merge_sort", "distribution": "random", "size": 1000, "seconds": 0.010},
+        {"algorithm": "quick_sort", "distribution": "random", "size": 1000, "seconds": 0.0001},
+    ]
+    results = [
+        {"algorithm": "merge_sort", "distribution": "random", "size": 1000, "seconds": 0.020},
+        {"algorithm": "quick_sort", "distribution": "random", "size": 1000, "seconds": 0.0009},
+        {"algorithm": "adaptive_sort", "distribution": "random", "size": 1000, "seconds": 1.0},
+    ]
+
+    regressions = find_regressions(results, baseline, threshold=0.5, min_seconds=0.001)
+
+    assert [record["algorithm"] for record in regressions] == ["merge_sort"]
+    assert regressions[0]["slowdown"] > 0.5
+
+
+def test_main_writes_report_and_fails_on_regression(tmp_path, capsys):
+    output = tmp_path / "results.json"
+    args = ["--sizes", "20", "--algorithms", "merge_sort", "--distributions", "random", "--repeat", "1"]
+    assert main(args + ["--output", str(output)]) == 0
+
+    report = json.loads(output.read_text(encoding="utf-8"))
+    assert report["results"][0]["algorithm"] == "merge_sort"
+
+    report["results"][0]["seconds"] = 1e-9
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps(report), encoding="utf-8")
+    assert main(args + ["--baseline", str(baseline), "--min-seconds", "0"]) == 1
+    assert "REGRESSION merge_sort" in capsys.readouterr().out
+
+
+def test_run_search_benchmarks_counts_probes():
+    results = run_search_benchmarks(SEARCH_CASES, ["uniform"], [20000], repeat=1, lookups=200)
+    probes = {record["algorithm"]: record["probes"] for record in results}
+
+    assert set(probes) == set(SEARCH_CASES)
+    assert probes["interpolation_search"] < probes["binary_search"]
+
+
+def test_main_rejects_algorithms_from_another_suite():
+    with pytest.raises(SystemExit):
+        main(["--suite", "search", "--algorithms", "merge_sort"])
+
+
+def test_run_fibonacci_benchmarks_respects_size_limits(capsys):
+    results = run_fibonacci_benchmarks(FIBONACCI_CASES, [30, 500_000], repeat=1)
+    measured = {(record["algorithm"], record["size"]) for record in results}
+
+    assert {name for name, size in measured if size == 30} == set(FIBONACCI_CASES)
+    assert ("fibonacci_recursive", 500_000) not in measured
+    assert ("fibonacci_iterative", 500_000) not in measured
+    assert ("fibonacci_fast_doubling", 500_000) in measured
+
+    assert main(["--suite", "fibonacci", "--sizes", "100", "--repeat", "1"]) == 0
+    assert "fibonacci_fast_doubling" in capsys.readouterr().out
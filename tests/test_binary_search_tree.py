@@ -1,5 +1,7 @@
+import random
+
 import pytest
-from core.data_structures.binary_search_tree import BinarySearchTree
+from core.data_structures.binary_search_tree import AVLTree, BinarySearchTree
 
 
 @pytest.fixture
@@ -36,3 +38,71 @@ def test_preorder_traversal(bst):
 def test_postorder_traversal(bst):
     assert bst.postorder_traversal() == [2, 4, 3, 6, 8, 7, 5]
 
+
+def _check_avl(node):
+    """Return the height of the subtree, asserting the AVL invariants on the way."""
+    if node is None:
+        return 0
+    left, right = _check_avl(node.left), _check_avl(node.right)
+    assert abs(left - right) <= 1
+    assert node.height == 1 + max(left, right)
+    return node.height
+
+
+@pytest.fixture
+def avl():
+    avl = AVLTree()
+    for value in [5, 3, 7, 2, 4, 6, 8]:
+        avl.insert(value)
+    return avl
+
+
+def test_avl_matches_bst_api(avl, bst):
+    assert avl.inorder_traversal() == bst.inorder_traversal()
+    assert avl.preorder_traversal() == bst.preorder_traversal()
+    assert avl.postorder_traversal() == bst.postorder_traversal()
+    assert avl.search(4) is True
+    assert avl.search(10) is False
+    avl.delete(7)
+    assert avl.search(7) is False
+    assert avl.inorder_traversal() == [2, 3, 4, 5, 6, 8]
+    avl.delete(100)
+    assert len(avl) == 6
+
+
+def test_avl_stays_balanced_on_sorted_inserts():
+    avl = AVLTree()
+    size = 50_000
+    for key in range(size):
+        avl.insert(key)
+    stats = avl.height_stats()
+    assert stats["size"] == size
+    assert stats["height"] <= stats["max_height"]
+    assert avl.height() == 16
+    assert avl.inorder_traversal() == list(range(size))
+    assert _check_avl(avl.root) == avl.height()
+
+
+def test_avl_random_inserts_and_deletes():
+    rng = random.Random(25)
+    avl = AVLTree()
+    expected = []
+    for _ in range(3000):
+        value = rng.randrange(500)
+        if expected and rng.random() < 0.4:
+            value = rng.choice(expected)
+            avl.delete(value)
+            expected.remove(value)
+        else:
+            avl.insert(value)
+            expected.append(value)
+    assert avl.inorder_traversal() == sorted(expected)
+    assert len(avl) == len(expected)
+    _check_avl(avl.root)
+    assert avl.height_stats()["height"] <= avl.height_stats()["max_height"]
+    for value in range(500):
+        assert avl.search(value) is (value in expected)
+
+    for value in list(expected):
+        avl.delete(value)
+    assert avl.root is None and avl.height() == 0
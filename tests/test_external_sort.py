@@ -0,0 +1,64 @@
+import random
+import struct
+
+import pytest
+
+from core.algorithms.external_sort import (
+    LineCodec,
+    StructCodec,
+    external_sort,
+    iter_external_sort,
+)
+
+
+def test_external_sort_lines_with_multiple_merge_passes(tmp_path):
+    rng = random.Random(9)
+    words = [f"word{rng.randint(0, 10**6):07d}" for _ in range(2000)]
+    source = tmp_path / "input.txt"
+    destination = tmp_path / "output.txt"
+    source.write_text("\n".join(words), encoding="utf-8")
+
+    count = external_sort(source, destination, memory_limit=4096, fan_in=3)
+
+    assert count == len(words)
+    assert destination.read_text(encoding="utf-8").splitlines() == sorted(words)
+
+
+def test_external_sort_fixed_width_records(tmp_path):
+    rng = random.Random(10)
+    codec = StructCodec("<qd")
+    records = [(rng.randint(-1000, 1000), rng.random()) for _ in range(1500)]
+    source = tmp_path / "input.bin"
+    destination = tmp_path / "output.bin"
+    source.write_bytes(b"".join(struct.pack("<qd", *record) for record in records))
+
+    external_sort(source, destination, codec=codec, memory_limit=8192, fan_in=4)
+
+    output = list(struct.iter_unpack("<qd", destination.read_bytes()))
+    assert output == sorted(records)
+
+
+def test_iter_external_sort_is_lazy_and_cleans_up(tmp_path):
+    source = tmp_path / "input.txt"
+    source.write_text("\n".join(str(value) for value in range(500, 0, -1)), encoding="utf-8")
+    spill_dir = tmp_path / "spill"
+    spill_dir.mkdir()
+
+    records = iter_external_sort(source, LineCodec(), memory_limit=1024, temp_dir=spill_dir)
+    assert next(records) == "1"
+    assert any(spill_dir.iterdir())
+    records.close()
+    assert not any(spill_dir.iterdir())
+
+
+def test_iter_external_sort_in_memory_when_input_fits(tmp_path):
+    source = tmp_path / "input.txt"
+    source.write_text("c\na\nb\n", encoding="utf-8")
+    assert list(iter_external_sort(source)) == ["a", "b", "c"]
+
+
+def test_iter_external_sort_rejects_invalid_options(tmp_path):
+    with pytest.raises(ValueError):
+        list(iter_external_sort(tmp_path / "missing.txt", fan_in=1))
+    with pytest.raises(ValueError):
+        list(iter_external_sort(tmp_path / "missing.txt", memory_limit=0))
@@ -1,5 +1,21 @@
+import random
+import threading
+
 import pytest
-from core.algorithms.fibonacci_methods import fibonacci_recursive, fibonacci_iterative
+from core.algorithms.fibonacci_methods import (
+    FIBONACCI_CACHE,
+    FibonacciCache,
+    fibonacci,
+    fibonacci_cached,
+    fibonacci_fast_doubling,
+    fibonacci_iterative,
+    fibonacci_many,
+    fibonacci_matrix,
+    fibonacci_mod,
+    fibonacci_range,
+    fibonacci_recursive,
+    fibonacci_sequence,
+)
 
 
 def test_fibonacci_recursive():
@@ -22,3 +38,123 @@ def test_fibonacci_negative():
     with pytest.raises(ValueError):
         fibonacci_iterative(-1)
 
+
+@pytest.mark.parametrize("calculate", [fibonacci_fast_doubling, fibonacci_matrix, fibonacci])
+def test_fast_methods_match_iterative(calculate):
+    for n in list(range(100)) + [255, 256, 257, 1000, 4097]:
+        assert calculate(n) == fibonacci_iterative(n)
+
+
+def test_fast_methods_handle_large_n():
+    value = fibonacci_fast_doubling(100_000)
+    assert value == fibonacci_matrix(100_000)
+    assert value == fibonacci(100_000) == fibonacci(99_999) + fibonacci(99_998)
+    assert value.bit_length() == 69424
+    assert value % 10**10 == 3428746875
+
+
+def test_fibonacci_dispatch():
+    for method in ["auto", "fast_doubling", "matrix", "iterative", "recursive"]:
+        assert fibonacci(30, method=method) == 832040
+    with pytest.raises(ValueError):
+        fibonacci(10, method="closed_form")
+    with pytest.raises(ValueError):
+        fibonacci(-1)
+    with pytest.raises(ValueError):
+        fibonacci_fast_doubling(-1)
+    with pytest.raises(ValueError):
+        fibonacci_matrix(-1)
+
+
+def test_fibonacci_sequence_streams_from_any_start():
+    expected = [fibonacci_iterative(n) for n in range(300)]
+    assert list(fibonacci_sequence(stop=300)) == expected
+    assert list(fibonacci_sequence(123, 300)) == expected[123:]
+    assert list(fibonacci_sequence(5, 5)) == []
+
+    unbounded = fibonacci_sequence(1000)
+    assert [next(unbounded) for _ in range(3)] == [fibonacci(n) for n in range(1000, 1003)]
+
+
+def test_fibonacci_range():
+    assert fibonacci_range(10, 15) == [55, 89, 144, 233, 377]
+    assert fibonacci_range(0, 2) == [0, 1]
+    assert fibonacci_range(7, 3) == []
+    first, second = fibonacci_range(10**6, 10**6 + 2)
+    assert second - first == fibonacci(10**6 - 1)
+    with pytest.raises(ValueError):
+        fibonacci_range(-1, 3)
+
+
+def test_fibonacci_cache_is_bounded_lru_with_stats():
+    cache = FibonacciCache(maxsize=2)
+    assert cache.get(10) == 55
+    assert cache.get(20) == 6765
+    assert cache.get(10) == 55
+    assert cache.get(30) == 832040
+    assert 20 not in cache and 10 in cache and 30 in cache
+    assert cache.info() == {"hits": 1, "misses": 3, "size": 2, "maxsize": 2}
+    cache.clear()
+    assert cache.info() == {"hits": 0, "misses": 0, "size": 0, "maxsize": 2}
+    with pytest.raises(ValueError):
+        FibonacciCache(maxsize=0)
+
+
+def test_fibonacci_cache_is_thread_safe():
+    cache = FibonacciCache(maxsize=16)
+    errors = []
+
+    def worker(offset):
+        for n in range(200):
+            if cache.get((n + offset) % 40) != fibonacci((n + offset) % 40):
+                errors.append(n)
+
+    threads = [threading.Thread(target=worker, args=(offset,)) for offset in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    info = cache.info()
+    assert not errors
+    assert info["hits"] + info["misses"] == 8 * 200
+    assert len(cache) <= 16
+
+
+def test_fibonacci_cached_uses_shared_cache():
+    before = FIBONACCI_CACHE.info()
+    assert fibonacci_cached(12_345) == fibonacci(12_345)
+    assert fibonacci_cached(12_345) == fibonacci(12_345)
+    after = FIBONACCI_CACHE.info()
+    assert after["hits"] >= before["hits"] + 1
+    with pytest.raises(ValueError):
+        fibonacci_cached(-1)
+
+
+def test_fibonacci_mod_matches_exact_values():
+    for m in [1, 2, 3, 10, 97, 1000, 2**16 + 1, 10**9 + 7, 2**61 - 1]:
+        for n in [0, 1, 2, 59, 60, 61, 1000, 3000]:
+            assert fibonacci_mod(n, m) == fibonacci(n) % m
+
+
+def test_fibonacci_mod_huge_n():
+    n = 10**18
+    assert fibonacci_mod(n, 10) == fibonacci_mod(n % 60, 10)
+    assert fibonacci_mod(n, 1_000_000_007) == 209783453
+    with pytest.raises(ValueError):
+        fibonacci_mod(5, 0)
+    with pytest.raises(ValueError):
+        fibonacci_mod(-5, 7)
+
+
+def test_fibonacci_many_preserves_order_and_duplicates():
+    rng = random.Random(20)
+    ns = [rng.randrange(0, 3000) for _ in range(200)] + [0, 1, 2, 2, 5000, 5019, 5020]
+    rng.shuffle(ns)
+    assert fibonacci_many(ns) == [fibonacci(n) for n in ns]
+    assert fibonacci_many(iter([10, 10, 0])) == [55, 55, 0]
+    assert fibonacci_many([]) == []
+
+
+def test_fibonacci_many_rejects_negative_positions():
+    with pytest.raises(ValueError):
+        fibonacci_many([3, -1])
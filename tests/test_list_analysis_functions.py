@@ -1,4 +1,16 @@
-from core.algorithms.list_analysis_functions import is_sorted, find_max
+import random
+from array import array
+from multiprocessing.shared_memory import SharedMemory
+
+import pytest
+
+from core.algorithms.list_analysis_functions import (
+    find_max,
+    is_sorted,
+    parallel_summarize,
+    sortedness_profile,
+    summarize,
+)
 
 
 def test_is_sorted():
@@ -14,3 +26,224 @@ def test_find_max():
     assert find_max([]) is None
     assert find_max([1]) == 1
 
+
+def test_find_max_and_is_sorted_handle_long_inputs_and_iterators():
+    items = list(range(200_000))
+    assert find_max(items) == 199_999
+    assert is_sorted(items)
+    assert is_sorted(iter(items))
+    assert not is_sorted(value % 1000 for value in range(5000))
+    assert find_max(iter([3, 9, 2])) == 9
+
+
+def _expected_summary(items):
+    return {
+        "count": len(items),
+        "sum": sum(items),
+        "min": min(items),
+        "max": max(items),
+        "argmin": items.index(min(items)),
+        "argmax": items.index(max(items)),
+        "is_sorted": items == sorted(items),
+    }
+
+
+@pytest.mark.parametrize("size", [1, 2, 1000, 200_001])
+def test_summarize_matches_builtins(size):
+    rng = random.Random(size)
+    items = [rng.randrange(-1000, 1000) for _ in range(size)]
+    expected = _expected_summary(items)
+    assert summarize(items) == expected
+    assert summarize(iter(items)) == expected
+    assert summarize(array("q", items)) == expected
+
+
+def test_summarize_detects_sortedness_across_chunks():
+    items = list(range(150_000))
+    assert summarize(items)["is_sorted"]
+    items[65_536], items[65_535] = items[65_535], items[65_536]
+    assert not summarize(items)["is_sorted"]
+    assert not summarize(iter(items))["is_sorted"]
+
+
+def test_summarize_with_key_and_non_numeric_items():
+    words = ["pear", "fig", "banana", "kiwi"]
+    summary = summarize(words, key=len)
+    assert summary["min"] == "fig" and summary["argmin"] == 1
+    assert summary["max"] == "banana" and summary["argmax"] == 2
+    assert summary["sum"] == 17
+    assert not summary["is_sorted"]
+
+    letters = summarize(["a", "b", "c"])
+    assert letters["sum"] is None
+    assert letters["is_sorted"] and letters["max"] == "c"
+
+
+def test_summarize_empty():
+    expected = {
+        "count": 0,
+        "sum": 0,
+        "min": None,
+        "max": None,
+        "argmin": None,
+        "argmax": None,
+        "is_sorted": True,
+    }
+    assert summarize([]) == expected
+    assert summarize(iter(())) == expected
+
+
+def test_summarize_numpy():
+    np = pytest.importorskip("numpy")
+    items = [5, 3, 9, 9, -2, 0]
+    assert summarize(np.array(items)) == _expected_summary(items)
+
+
+def _brute_force_inversions(items):
+    return sum(
+        1 for i in range(len(items)) for j in range(i + 1, len(items)) if items[i] > items[j]
+    )
+
+
+@pytest.mark.parametrize("size", [0, 1, 2, 31, 32, 33, 100, 257])
+def test_sortedness_profile_counts_inversions(size):
+    rng = random.Random(size)
+    items = [rng.randrange(10) for _ in range(size)]
+    profile = sortedness_profile(items)
+    assert profile["inversions"] == _brute_force_inversions(items)
+    assert profile["is_sorted"] == (items == sorted(items))
+    assert sum(map(abs, profile["runs"])) == size
+    assert profile["run_count"] == len(profile["runs"])
+
+
+def test_sortedness_profile_runs_and_first_inversion():
+    profile = sortedness_profile([1, 3, 2, 4, 0])
+    assert profile == {
+        "is_sorted": False,
+        "first_inversion": 1,
+        "run_count": 3,
+        "runs": [2, 2, 1],
+        "inversions": 5,
+    }
+    assert sortedness_profile(iter([2, 2, 3]))["runs"] == [3]
+    assert sortedness_profile([])["run_count"] == 0
+
+
+def test_sortedness_profile_finds_descending_runs():
+    profile = sortedness_profile(list(range(1000, 0, -1)), count_inversions=False)
+    assert profile["run_count"] == 1
+    assert profile["runs"] == [-1000]
+    assert sortedness_profile([3, 2, 1, 1, 2, 5, 4])["runs"] == [-3, 3, 1]
+    assert sortedness_profile([2, 2, 1])["runs"] == [2, 1]
+
+
+def test_sortedness_profile_extremes_and_skipped_count():
+    size = 5000
+    assert sortedness_profile(list(range(size)))["inversions"] == 0
+    assert sortedness_profile(list(range(size, 0, -1)))["inversions"] == size * (size - 1) // 2
+    profile = sortedness_profile(array("d", [2.0, 1.0, 3.0]), count_inversions=False)
+    assert profile["inversions"] is None
+    assert profile["first_inversion"] == 0
+
+
+def test_sortedness_profile_first_descent_only_stops_early():
+    def values():
+        yield from [1, 2, 5, 3]
+        raise AssertionError("consumed past the first descent")
+
+    profile = sortedness_profile(values(), first_descent_only=True)
+    assert profile == {
+        "is_sorted": False,
+        "first_inversion": 2,
+        "run_count": None,
+        "runs": None,
+        "inversions": None,
+    }
+    assert sortedness_profile([1, 1, 2], first_descent_only=True)["is_sorted"] is True
+    assert sortedness_profile(array("q"), first_descent_only=True)["first_inversion"] is None
+
+
+def test_sortedness_profile_numpy_matches_python():
+    np = pytest.importorskip("numpy")
+    rng = random.Random(3)
+    for size in [0, 1, 2, 7, 64, 1000]:
+        items = [rng.randrange(50) for _ in range(size)]
+        assert sortedness_profile(np.array(items)) == sortedness_profile(items)
+        assert sortedness_profile(
+            np.array(items), first_descent_only=True
+        ) == sortedness_profile(items, first_descent_only=True)
+
+
+@pytest.mark.parametrize("typecode", ["q", "d"])
+def test_parallel_summarize_matches_summarize(typecode):
+    rng = random.Random(24)
+    items = array(typecode, [rng.randrange(-500, 500) for _ in range(10_001)])
+    assert parallel_summarize(items, workers=3, threshold=0) == summarize(items)
+    assert parallel_summarize(items, workers=3) == summarize(items)
+
+
+def test_summaries_skip_nan_at_the_start_of_a_chunk():
+    rng = random.Random(21)
+    items = array("d", [rng.uniform(-1000, 1000) for _ in range(150_000)])
+    # 65_536 opens the second summary chunk, 50_000 the second of three worker chunks.
+    items[50_000] = items[65_536] = float("nan")
+    items[100_000], items[140_000] = -5000.0, 5000.0
+    expected = summarize(iter(items))
+    assert (expected["argmin"], expected["argmax"]) == (100_000, 140_000)
+    for summary in (summarize(items), parallel_summarize(items, workers=3, threshold=0)):
+        assert {key: value for key, value in summary.items() if key != "sum"} == {
+            key: value for key, value in expected.items() if key != "sum"
+        }
+
+    items[0] = float("nan")
+    for summary in (summarize(items), parallel_summarize(items, workers=3, threshold=0)):
+        assert summary["argmin"] == summary["argmax"] == 0
+        assert summary["min"] != summary["min"]
+
+
+def test_parallel_summarize_checks_chunk_boundaries():
+    items = array("i", range(9000))
+    assert parallel_summarize(items, workers=3, threshold=0)["is_sorted"]
+    items[2999], items[3000] = items[3000], items[2999]
+    assert not parallel_summarize(items, workers=3, threshold=0)["is_sorted"]
+
+
+def test_parallel_summarize_reads_shared_memory_in_place():
+    items = array("d", [float(value) for value in range(1000, 0, -1)])
+    shm = SharedMemory(create=True, size=len(items) * items.itemsize)
+    try:
+        shm.buf[: len(items) * items.itemsize] = items.tobytes()
+        summary = parallel_summarize(shm, workers=2, threshold=0, typecode="d", length=len(items))
+        assert summary == summarize(items)
+        with pytest.raises(ValueError):
+            parallel_summarize(shm)
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def test_parallel_summarize_rejects_lengths_outside_the_block():
+    shm = SharedMemory(create=True, size=8 * 100)
+    try:
+        capacity = shm.size // 8
+        assert parallel_summarize(shm, typecode="q", length=0) == summarize([])
+        with pytest.raises(ValueError):
+            parallel_summarize(shm, typecode="q", length=-2)
+        with pytest.raises(ValueError):
+            parallel_summarize(shm, typecode="q", length=capacity + 1)
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def test_parallel_summarize_falls_back_for_lists_and_empty_input():
+    assert parallel_summarize([3, 1, 2], workers=4, threshold=0) == summarize([3, 1, 2])
+    assert parallel_summarize(array("q"), workers=2, threshold=0) == summarize([])
+
+
+def test_parallel_summarize_rejects_multi_dimensional_buffers():
+    matrix = memoryview(array("d", [1.0, 2.0, 3.0, 4.0, 5.0, 6.0])).cast("B").cast("d", (2, 3))
+    with pytest.raises(ValueError):
+        parallel_summarize(matrix, workers=2, threshold=0)
+    with pytest.raises(ValueError):
+        parallel_summarize(matrix, workers=2)
@@ -0,0 +1,66 @@
+import random
+from array import array
+
+import pytest
+
+from core.algorithms.numeric_sort import numeric_sort
+
+
+def test_numeric_sort_small_range_scores():
+    scores = [88, 92, 75, 100, 0, 63, 92, 75]
+    result = numeric_sort(scores)
+    assert result is scores
+    assert result == [0, 63, 75, 75, 88, 92, 92, 100]
+    assert numeric_sort([]) == []
+    assert numeric_sort([1]) == [1]
+
+
+def test_numeric_sort_wide_range_ints():
+    rng = random.Random(4)
+    values = [rng.randint(-(10**12), 10**12) for _ in range(3000)]
+    assert numeric_sort(values.copy()) == sorted(values)
+
+
+def test_numeric_sort_floats_with_signs():
+    values = [3.5, -0.0, -2.25, float("inf"), 0.0, -1e300, 1e-300, -float("inf")]
+    assert numeric_sort(values.copy()) == sorted(values)
+
+
+def test_numeric_sort_keeps_array_type():
+    rng = random.Random(5)
+    ints = array("q", [rng.randint(-(2**63), 2**63 - 1) for _ in range(1000)])
+    floats = array("f", [rng.uniform(-100, 100) for _ in range(1000)])
+    expected_ints, expected_floats = sorted(ints), sorted(floats)
+
+    assert numeric_sort(ints) is ints
+    assert ints.typecode == "q" and ints.tolist() == expected_ints
+    assert numeric_sort(floats) is floats
+    assert floats.typecode == "f" and floats.tolist() == expected_floats
+
+
+def test_numeric_sort_rejects_mixed_types():
+    with pytest.raises(TypeError):
+        numeric_sort([1, 2.5, 3])
+    with pytest.raises(TypeError):
+        numeric_sort(["b", "a"])
+
+
+def test_numeric_sort_numpy_arrays():
+    np = pytest.importorskip("numpy")
+    rng = np.random.default_rng(6)
+    for values in (
+        rng.integers(0, 101, 5000, dtype=np.int8),
+        rng.integers(-(2**62), 2**62, 5000, dtype=np.int64),
+        rng.integers(0, 2**64 - 1, 5000, dtype=np.uint64),
+        rng.standard_normal(5000),
+    ):
+        expected = np.sort(values)
+        result = numeric_sort(values)
+        assert result is values
+        assert np.array_equal(result, expected)
+
+
+def test_numeric_sort_rejects_multi_dimensional_numpy_arrays():
+    np = pytest.importorskip("numpy")
+    with pytest.raises(ValueError):
+        numeric_sort(np.zeros((2, 3)))
@@ -0,0 +1,35 @@
+import random
+from array import array
+
+import pytest
+
+from core.algorithms.parallel_search import parallel_linear_search
+
+
+@pytest.mark.parametrize("position", [0, 1, 2_499, 5_000, 9_999])
+def test_parallel_linear_search_finds_lowest_index(position):
+    rng = random.Random(position)
+    dataset = array("q", [rng.randrange(1, 10**9) for _ in range(10_000)])
+    dataset[position] = 0
+    dataset[-1] = 0
+    result = parallel_linear_search(0, dataset, workers=3, threshold=0, chunk_size=700)
+    assert result == position
+
+
+def test_parallel_linear_search_missing_item():
+    dataset = array("d", [float(value) for value in range(5_000)])
+    assert parallel_linear_search(-1.0, dataset, workers=2, threshold=0, chunk_size=512) is None
+
+
+def test_parallel_linear_search_falls_back_for_lists_and_small_inputs():
+    assert parallel_linear_search(3, [5, 3, 3], workers=4, threshold=0) == 1
+    assert parallel_linear_search("b", ["a", "b"]) == 1
+    assert parallel_linear_search(7, array("i", [1, 2, 7])) == 2
+    assert parallel_linear_search(1, array("i"), workers=2, threshold=0) is None
+
+
+def test_parallel_linear_search_numpy():
+    np = pytest.importorskip("numpy")
+    dataset = np.arange(20_000, dtype=np.int64)
+    result = parallel_linear_search(12_345, dataset, workers=2, threshold=0, chunk_size=4096)
+    assert result == 12_345
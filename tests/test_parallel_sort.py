@@ -0,0 +1,41 @@
+import random
+from array import array
+
+import pytest
+
+from core.algorithms.parallel_sort import parallel_sort
+
+
+def test_parallel_sort_list_of_ints():
+    rng = random.Random(7)
+    dataset = [rng.randint(-(10**9), 10**9) for _ in range(5000)]
+    expected = sorted(dataset)
+    result = parallel_sort(dataset, workers=3, threshold=0)
+    assert result is dataset
+    assert result == expected
+
+
+def test_parallel_sort_array_of_floats_with_duplicates():
+    rng = random.Random(8)
+    dataset = array("d", [float(rng.randint(0, 5)) for _ in range(3001)])
+    expected = sorted(dataset)
+    result = parallel_sort(dataset, workers=2, threshold=0)
+    assert result is dataset
+    assert result.tolist() == expected
+
+
+def test_parallel_sort_falls_back_below_threshold():
+    assert parallel_sort([3, 1, 2]) == [1, 2, 3]
+    assert parallel_sort([], workers=4, threshold=0) == []
+
+
+def test_parallel_sort_rejects_non_numeric_data():
+    with pytest.raises(TypeError):
+        parallel_sort(["b", "a", "c"], workers=2, threshold=0)
+
+
+def test_parallel_sort_falls_back_for_ints_beyond_64_bits():
+    rng = random.Random(9)
+    dataset = [rng.randint(-(2**80), 2**80) for _ in range(3000)]
+    expected = sorted(dataset)
+    assert parallel_sort(dataset, workers=2, threshold=0) == expected
@@ -0,0 +1,93 @@
+import math
+import random
+import statistics
+
+import pytest
+
+from core.algorithms.rolling_statistics import QuantileSketch, RollingStatistics
+
+
+@pytest.mark.parametrize("exact_quantiles", [False, True])
+def test_count_window_matches_recomputation(exact_quantiles):
+    rng = random.Random(23)
+    values = [rng.uniform(-100, 100) for _ in range(2000)]
+    stats = RollingStatistics(window=50, exact_quantiles=exact_quantiles)
+    for end, value in enumerate(values, 1):
+        stats.push(value)
+        window = values[max(0, end - 50) : end]
+        assert len(stats) == len(window)
+        assert stats.max == max(window)
+        assert stats.min == min(window)
+        assert math.isclose(stats.mean, statistics.fmean(window), abs_tol=1e-9)
+        expected_variance = statistics.pvariance(window)
+        assert math.isclose(stats.variance, expected_variance, rel_tol=1e-6, abs_tol=1e-6)
+        ordered = sorted(window)
+        assert stats.quantile(0.5) == ordered[math.ceil(0.5 * len(window)) - 1]
+        assert stats.quantile(0) == ordered[0] and stats.quantile(1) == ordered[-1]
+
+
+def test_time_window_evicts_old_values():
+    stats = RollingStatistics(time_window=10)
+    stats.extend([1, 5, 3, 8], timestamps=[0, 4, 9, 12])
+    assert len(stats) == 3
+    assert stats.max == 8 and stats.min == 3
+    assert stats.quantile(0.5) == 5
+    assert stats.mean == pytest.approx(16 / 3)
+    stats.push(2, timestamp=30)
+    assert len(stats) == 1 and stats.max == stats.min == 2
+    with pytest.raises(ValueError):
+        stats.push(4, timestamp=29)
+    with pytest.raises(ValueError):
+        stats.push(4)
+
+
+def test_count_and_time_windows_combine():
+    stats = RollingStatistics(window=2, time_window=100)
+    stats.extend([3, 1, 2], timestamps=[0, 1, 2])
+    assert len(stats) == 2 and stats.max == 2 and stats.min == 1
+
+
+def test_ewma_and_unbounded_window():
+    stats = RollingStatistics(alpha=0.5)
+    assert stats.mean is None and stats.max is None and stats.ewma is None
+    stats.extend([10, 20, 30])
+    assert stats.ewma == pytest.approx(22.5)
+    assert stats.max == 30 and stats.min == 10 and stats.mean == pytest.approx(20)
+    stats.extend(range(100, 0, -1))
+    assert stats.max == 100 and stats.min == 1
+    assert len(stats._maxima) == 1 and len(stats._minima) == 1
+
+
+def test_quantile_sketch_is_bounded_and_accurate():
+    rng = random.Random(7)
+    values = [rng.random() for _ in range(100_000)]
+    sketch = QuantileSketch(capacity=200)
+    sketch.extend(values)
+    stored = sum(len(level) for level in sketch._levels)
+    assert len(sketch) == len(values)
+    assert stored < 200 * len(sketch._levels)
+    assert stored < 5000
+    for q in [0.01, 0.25, 0.5, 0.75, 0.99]:
+        assert abs(sketch.quantile(q) - q) < 0.03
+
+
+def test_rolling_statistics_rejects_invalid_arguments():
+    with pytest.raises(ValueError):
+        RollingStatistics(window=0)
+    with pytest.raises(ValueError):
+        RollingStatistics(time_window=0)
+    with pytest.raises(ValueError):
+        RollingStatistics(alpha=0)
+    with pytest.raises(ValueError):
+        RollingStatistics(window=3).quantile(0.5)
+    with pytest.raises(ValueError):
+        QuantileSketch(capacity=1)
+    with pytest.raises(ValueError):
+        QuantileSketch().quantile(1.5)
+
+
+def test_windowed_push_keeps_no_sorted_copy_by_default():
+    stats = RollingStatistics(window=1000)
+    stats.extend(range(5000))
+    assert stats._sorted is None
+    assert len(stats._values) == 1000
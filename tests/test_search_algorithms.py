@@ -1,6 +1,19 @@
+import random
+
 import pytest
 
-from core.algorithms.search_algorithms import binary_search, linear_search
+from core.algorithms.search_algorithms import (
+    EytzingerIndex,
+    NOT_FOUND,
+    SearchIndex,
+    SortedArray,
+    binary_search,
+    binary_search_many,
+    exponential_search,
+    interpolation_search,
+    linear_search,
+    linear_search_stream,
+)
 
 
 def test_linear_search():
@@ -10,6 +23,20 @@ def test_linear_search():
     assert linear_search(10, items) == 0
 
 
+def test_linear_search_stream_consumes_lazily():
+    consumed = []
+
+    def values():
+        for value in [4, 8, 15, 16, 23, 42]:
+            consumed.append(value)
+            yield value
+
+    assert linear_search_stream(15, values()) == 2
+    assert consumed == [4, 8, 15]
+    assert linear_search_stream(99, values()) is None
+    assert linear_search_stream("b\n", iter(["a\n", "b\n"])) == 1
+
+
 def test_binary_search():
     items = [10, 20, 30, 40, 50]
     assert binary_search(30, items) == 2
@@ -21,3 +48,191 @@ def test_binary_search_rejects_unsorted_input():
     with pytest.raises(ValueError):
         binary_search(30, [10, 50, 30, 40])
 
+
+def test_sorted_array_lookups():
+    table = SortedArray([50, 10, 30, 30, 20])
+    assert list(table) == [10, 20, 30, 30, 50]
+    assert table.bisect_left(30) == 2
+    assert table.bisect_right(30) == 4
+    assert table.index(30) == 2
+    assert table.count(30) == 2
+    assert table.count(40) == 0
+    assert table.range(15, 50) == [20, 30, 30]
+    assert 20 in table and 25 not in table
+    with pytest.raises(ValueError):
+        table.index(25)
+
+
+def test_sorted_array_insert_and_remove_keep_order():
+    table = SortedArray()
+    for value in [5, 1, 4, 1, 3]:
+        table.insert(value)
+    assert list(table) == [1, 1, 3, 4, 5]
+    table.remove(1)
+    table.remove(5)
+    assert list(table) == [1, 3, 4]
+    assert len(table) == 3
+    with pytest.raises(ValueError):
+        table.remove(2)
+
+
+def test_sorted_array_from_sorted_validates_once():
+    table = SortedArray.from_sorted([10, 20, 30, 40, 50])
+    assert binary_search(40, table) == 3
+    assert binary_search(45, table) is None
+    with pytest.raises(ValueError):
+        SortedArray.from_sorted([10, 50, 30])
+
+
+def test_binary_search_many_sorted_and_unsorted_keys():
+    items = [10, 20, 20, 30, 40, 50]
+    assert list(binary_search_many([5, 10, 20, 35, 50, 60], items)) == [
+        NOT_FOUND,
+        0,
+        1,
+        NOT_FOUND,
+        5,
+        NOT_FOUND,
+    ]
+    assert list(binary_search_many([50, 10, 35, 20], items)) == [5, 0, NOT_FOUND, 1]
+    assert list(binary_search_many([], items)) == []
+    assert list(binary_search_many([1, 2], [])) == [NOT_FOUND, NOT_FOUND]
+
+
+def test_binary_search_many_matches_binary_search():
+    rng = random.Random(16)
+    for size in (50, 5000):
+        table = SortedArray(rng.randint(0, 3 * size) for _ in range(size))
+        keys = sorted(rng.randint(0, 3 * size) for _ in range(200))
+        for result, key in zip(binary_search_many(keys, table), keys):
+            expected = table.index(key) if key in table else NOT_FOUND
+            assert result == expected
+
+
+def test_binary_search_many_rejects_unsorted_items():
+    with pytest.raises(ValueError):
+        binary_search_many([30], [10, 50, 30, 40])
+
+
+def test_binary_search_many_numpy():
+    np = pytest.importorskip("numpy")
+    items = np.array([10, 20, 20, 30, 40, 50])
+    result = binary_search_many(np.array([5, 20, 50, 60]), items)
+    assert result.tolist() == [NOT_FOUND, 1, 5, NOT_FOUND]
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_search_index_matches_linear_search(compact):
+    items = [30, 10, 30, 20, 10, 30]
+    index = SearchIndex(items, compact=compact)
+    for value in (10, 20, 30, 40):
+        assert index.find(value) == linear_search(value, items)
+    assert index.find_all(30) == [0, 2, 5]
+    assert index.count(10) == 2
+    assert index.find_all(40) == []
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_search_index_stays_correct_under_updates(compact):
+    rng = random.Random(17)
+    mirror = [rng.randint(0, 9) for _ in range(50)]
+    index = SearchIndex(mirror, compact=compact)
+    for _ in range(300):
+        operation = rng.choice(["append", "pop", "pop_any", "set"])
+        if operation == "append" or not mirror:
+            value = rng.randint(0, 9)
+            mirror.append(value)
+            index.append(value)
+        elif operation == "pop":
+            assert index.pop() == mirror.pop()
+        elif operation == "pop_any":
+            position = rng.randrange(len(mirror))
+            assert index.pop(position) == mirror.pop(position)
+        else:
+            position, value = rng.randrange(len(mirror)), rng.randint(0, 9)
+            mirror[position] = value
+            index[position] = value
+        for value in range(10):
+            assert index.find_all(value) == [i for i, item in enumerate(mirror) if item == value]
+    assert list(index) == mirror
+
+
+def test_search_index_accepts_numpy_arrays():
+    np = pytest.importorskip("numpy")
+    index = SearchIndex(np.array([3, 1, 3]))
+    assert index.find_all(3) == [0, 2]
+
+
+def test_search_index_pop_rejects_out_of_range():
+    with pytest.raises(IndexError):
+        SearchIndex().pop()
+
+
+@pytest.mark.parametrize("search", [interpolation_search, exponential_search])
+def test_numeric_searches(search):
+    items = [10, 20, 30, 40, 50]
+    assert search(30, items) == 2
+    assert search(100, items) is None
+    assert search(10, items) == 0
+    assert search(50, items) == 4
+    assert search(5, items) is None
+    assert search(35, items) is None
+    assert search(1, []) is None
+
+
+@pytest.mark.parametrize("search", [interpolation_search, exponential_search])
+def test_numeric_searches_on_skewed_data(search):
+    rng = random.Random(18)
+    items = sorted([int(rng.expovariate(0.001) ** 3) for _ in range(2000)] + [10**12])
+    for key in rng.sample(items, 100):
+        assert items[search(key, items)] == key
+    assert search(-1, items) is None
+
+
+def test_interpolation_search_rejects_unsorted_input():
+    with pytest.raises(ValueError):
+        interpolation_search(30, [10, 50, 30, 40])
+
+
+def test_exponential_search_without_length():
+    class Squares:
+        """An unbounded sorted sequence that only supports indexing."""
+
+        def __getitem__(self, index):
+            return index * index
+
+    assert exponential_search(144, Squares()) == 12
+    assert exponential_search(145, Squares()) is None
+
+
+def test_eytzinger_index_maps_back_to_sorted_positions():
+    rng = random.Random(19)
+    for size in (0, 1, 2, 7, 8, 1000):
+        values = [rng.randint(0, 500) for _ in range(size)]
+        ordered = sorted(values)
+        index = EytzingerIndex(values)
+        assert len(index) == size
+        for key in range(-1, 502):
+            position = index.lower_bound(key)
+            assert position == sum(value < key for value in ordered)
+            expected = position if position < size and ordered[position] == key else None
+            assert index.search(key) == expected
+
+
+def test_eytzinger_index_non_numeric_keys():
+    index = EytzingerIndex(["pear", "apple", "fig"])
+    assert index.search("fig") == 1
+    assert index.search("kiwi") is None
+    assert "apple" in index
+    assert index.lower_bound("zzz") == 3
+
+
+def test_interpolation_search_with_infinite_or_overflowing_bounds():
+    inf = float("inf")
+    assert interpolation_search(0.5, [-inf, 0.0, 1.0]) is None
+    assert interpolation_search(0.0, [-inf, 0.0, 1.0]) == 1
+    assert interpolation_search(0.0, [-1e308, 0.0, 1e308]) == 1
+    items = [-inf, -1e308, -1.0, 0.0, 2.5, 1e308, inf]
+    for index, value in enumerate(items):
+        assert interpolation_search(value, items) == index
+    assert interpolation_search(1.0, items) is None
@@ -0,0 +1,73 @@
+import random
+
+import pytest
+
+from core.algorithms.selection_algorithms import _select, nth_element, partial_sort, top_k
+
+
+def test_nth_element_places_median():
+    rng = random.Random(13)
+    for size in (1, 2, 17, 500):
+        dataset = [rng.randint(0, 100) for _ in range(size)]
+        expected = sorted(dataset)
+        middle = size // 2
+        result = nth_element(dataset, middle)
+        assert result is dataset
+        assert result[middle] == expected[middle]
+        assert all(value <= result[middle] for value in result[:middle])
+        assert all(value >= result[middle] for value in result[middle + 1 :])
+
+
+def test_nth_element_sorted_input_and_negative_index():
+    dataset = list(range(20000))
+    assert nth_element(dataset, -1)[-1] == 19999
+    assert nth_element(list(range(10)), 0, reverse=True)[0] == 9
+
+
+def test_nth_element_rejects_out_of_range_index():
+    with pytest.raises(IndexError):
+        nth_element([1, 2, 3], 3)
+    with pytest.raises(IndexError):
+        nth_element([], 0)
+
+
+def test_select_with_median_of_medians_pivots():
+    rng = random.Random(14)
+    dataset = [rng.randint(0, 1000) for _ in range(700)]
+    expected = sorted(dataset)
+    for n in (0, 123, 350, 699):
+        _select(dataset, 0, len(dataset), n, 0)
+        assert dataset[n] == expected[n]
+        assert all(value <= dataset[n] for value in dataset[:n])
+        assert all(value >= dataset[n] for value in dataset[n + 1 :])
+
+
+def test_partial_sort():
+    rng = random.Random(14)
+    dataset = [rng.randint(-50, 50) for _ in range(1000)]
+    expected = sorted(dataset)
+    assert partial_sort(dataset.copy(), 10)[:10] == expected[:10]
+    assert partial_sort(dataset.copy(), 2000) == expected
+    assert partial_sort(dataset.copy(), 10, reverse=True)[:10] == expected[::-1][:10]
+    assert partial_sort([3, 1, 2], 0) == [3, 1, 2]
+
+
+def test_partial_sort_with_key_is_stable():
+    records = [("b", 2), ("a", 1), ("b", 1), ("a", 2), ("c", 0)]
+    assert partial_sort(records.copy(), 3, key=lambda record: record[0])[:3] == [
+        ("a", 1),
+        ("a", 2),
+        ("b", 2),
+    ]
+
+
+def test_top_k_consumes_iterables_lazily():
+    def scores():
+        yield from [40, 90, 10, 90, 75, 60]
+
+    assert top_k(scores(), 3) == [90, 90, 75]
+    assert top_k(iter([]), 3) == []
+    assert top_k([1, 2], 0) == []
+    words = ["pear", "fig", "banana", "kiwi", "apple"]
+    assert top_k(words, 2, key=len) == ["banana", "apple"]
+    assert top_k(words, 10, key=len) == ["banana", "apple", "pear", "kiwi", "fig"]
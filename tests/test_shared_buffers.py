@@ -0,0 +1,35 @@
+from array import array
+
+import pytest
+
+from core.algorithms.shared_buffers import (
+    buffer_typecode,
+    read_chunk,
+    shared_copy,
+    split_range,
+    write_chunk,
+)
+
+
+def test_buffer_typecode():
+    assert buffer_typecode(array("d", [1.0])) == "d"
+    assert buffer_typecode(array("u", "abc")) is None
+    assert buffer_typecode([1, 2, 3]) is None
+    assert buffer_typecode(memoryview(array("q", range(10)))[::2]) is None
+    with pytest.raises(ValueError):
+        buffer_typecode(memoryview(array("q", range(6))).cast("B").cast("q", (2, 3)))
+
+
+def test_split_range_covers_everything_once():
+    assert split_range(10, 3) == [(0, 3), (3, 6), (6, 10)]
+    assert split_range(2, 4) == [(0, 1), (1, 2)]
+    assert split_range(0, 4) == []
+
+
+def test_shared_copy_round_trip():
+    values = array("i", range(100))
+    with shared_copy(values) as shm:
+        assert read_chunk(shm.name, "i", 10, 20).tolist() == list(range(10, 20))
+        write_chunk(shm.name, array("i", [-1, -2]), 98)
+        assert read_chunk(shm.name, "i", 97, 100).tolist() == [97, -1, -2]
+    assert values[98] == 98
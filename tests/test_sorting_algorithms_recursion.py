@@ -1,4 +1,15 @@
-from core.algorithms.sorting_algorithms_recursion import bubble_sort, merge_sort, quick_sort
+import random
+
+import pytest
+
+from core.algorithms.sorting_algorithms_recursion import (
+    _introsort,
+    adaptive_sort,
+    bottom_up_merge_sort,
+    bubble_sort,
+    merge_sort,
+    quick_sort,
+)
 
 
 def test_bubble_sort():
@@ -13,9 +24,141 @@ def test_merge_sort():
     assert merge_sort([1]) == [1]
 
 
+def test_bottom_up_merge_sort():
+    assert bottom_up_merge_sort([34, 21, 10]) == [10, 21, 34]
+    assert bottom_up_merge_sort([]) == []
+    assert bottom_up_merge_sort([1]) == [1]
+
+
+def test_bottom_up_merge_sort_reuses_buffer():
+    rng = random.Random(2)
+    buffer = [None] * 257
+    for size in (2, 3, 64, 100, 257):
+        dataset = [rng.randint(0, 50) for _ in range(size)]
+        expected = sorted(dataset)
+        result = bottom_up_merge_sort(dataset, buffer)
+        assert result is dataset
+        assert result == expected
+    assert len(buffer) == 257
+
+
+def test_bottom_up_merge_sort_rejects_short_buffer():
+    with pytest.raises(ValueError):
+        bottom_up_merge_sort([3, 2, 1], [None])
+
+
 def test_quick_sort():
     items = [34, 21, 10]
     assert quick_sort(items, 0, len(items) - 1) == [10, 21, 34]
     assert quick_sort([], 0, 0) == []
     assert quick_sort([1], 0, 0) == [1]
 
+
+def test_adaptive_sort():
+    assert adaptive_sort([34, 21, 10]) == [10, 21, 34]
+    assert adaptive_sort([]) == []
+    assert adaptive_sort([1]) == [1]
+
+
+def test_adaptive_sort_matches_sorted_on_mixed_runs():
+    rng = random.Random(0)
+    cases = [
+        list(range(1000)),
+        list(range(1000, 0, -1)),
+        [rng.randint(0, 100) for _ in range(2000)],
+        list(range(500)) + list(range(300, 0, -1)) + list(range(200, 900)),
+    ]
+    nearly_sorted = list(range(3000))
+    for _ in range(30):
+        a, b = rng.randrange(3000), rng.randrange(3000)
+        nearly_sorted[a], nearly_sorted[b] = nearly_sorted[b], nearly_sorted[a]
+    cases.append(nearly_sorted)
+
+    for case in cases:
+        expected = sorted(case)
+        result = adaptive_sort(case)
+        assert result is case
+        assert result == expected
+
+
+def test_adaptive_sort_is_stable():
+    class Record:
+        def __init__(self, score, order):
+            self.score = score
+            self.order = order
+
+        def __lt__(self, other):
+            return self.score < other.score
+
+    rng = random.Random(1)
+    records = [Record(rng.randint(0, 5), order) for order in range(500)]
+    result = adaptive_sort(records)
+    assert [(r.score, r.order) for r in result] == sorted((r.score, r.order) for r in result)
+
+
+def test_quick_sort_handles_sorted_and_duplicate_heavy_input():
+    rng = random.Random(3)
+    cases = [
+        list(range(20000)),
+        list(range(20000, 0, -1)),
+        [rng.randint(0, 100) for _ in range(20000)],
+        [7] * 5000,
+    ]
+    for case in cases:
+        expected = sorted(case)
+        assert quick_sort(case, 0, len(case) - 1) == expected
+
+
+def test_quick_sort_only_sorts_requested_segment():
+    assert quick_sort([5, 4, 3, 2, 1], 1, 3) == [5, 2, 3, 4, 1]
+
+
+def test_introsort_falls_back_to_heap_sort_when_depth_is_spent():
+    rng = random.Random(4)
+    dataset = [rng.randint(0, 50) for _ in range(500)]
+    expected = dataset[:10] + sorted(dataset[10:490]) + dataset[490:]
+    _introsort(dataset, 10, 490, 0)
+    assert dataset == expected
+
+
+SORTS_WITH_KEY = [
+    bubble_sort,
+    merge_sort,
+    bottom_up_merge_sort,
+    adaptive_sort,
+    lambda items, **options: quick_sort(items, 0, len(items) - 1, **options),
+]
+
+
+@pytest.mark.parametrize("sort", SORTS_WITH_KEY)
+def test_sorts_compute_each_key_once(sort):
+    rng = random.Random(11)
+    records = [(rng.choice("abc"), rng.randint(0, 100)) for _ in range(200)]
+    expected = sorted(records, key=lambda record: (record[0], -record[1]))
+    calls = []
+
+    def key(record):
+        calls.append(record)
+        return (record[0], -record[1])
+
+    assert sort(records.copy(), key=key) == expected
+    assert len(calls) == len(records)
+
+
+@pytest.mark.parametrize("sort", SORTS_WITH_KEY)
+def test_sorts_are_stable_with_key_and_reverse(sort):
+    rng = random.Random(12)
+    records = [(rng.randint(0, 4), order) for order in range(300)]
+
+    def first(record):
+        return record[0]
+
+    assert sort(records.copy(), key=first) == sorted(records, key=first)
+    assert sort(records.copy(), key=first, reverse=True) == sorted(
+        records, key=first, reverse=True
+    )
+    assert sort([3, 1, 2], reverse=True) == [3, 2, 1]
+
+
+def test_quick_sort_key_applies_to_segment_only():
+    assert quick_sort(["d", "ccc", "a", "bb", "e"], 1, 3, key=len) == ["d", "a", "bb", "ccc", "e"]
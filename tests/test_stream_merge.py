@@ -0,0 +1,39 @@
+import random
+
+from core.algorithms.stream_merge import merge_sorted
+
+
+def test_merge_sorted_mixed_inputs():
+    shards = [[1, 4, 7, 10], iter([2, 4, 8]), (value * 3 for value in range(4)), []]
+    assert list(merge_sorted(*shards)) == [0, 1, 2, 3, 4, 4, 6, 7, 8, 9, 10]
+    assert list(merge_sorted()) == []
+
+
+def test_merge_sorted_matches_sorted_on_many_shards():
+    rng = random.Random(15)
+    shards = [sorted(rng.randint(0, 1000) for _ in range(rng.randint(0, 50))) for _ in range(20)]
+    expected = sorted(value for shard in shards for value in shard)
+    assert list(merge_sorted(*shards)) == expected
+
+
+def test_merge_sorted_key_reverse_and_stability():
+    left = [("b", 3), ("a", 2), ("c", 1)]
+    right = [("d", 3), ("e", 1)]
+    merged = list(merge_sorted(left, right, key=lambda record: record[1], reverse=True))
+    assert merged == [("b", 3), ("d", 3), ("a", 2), ("c", 1), ("e", 1)]
+
+
+def test_merge_sorted_unique():
+    assert list(merge_sorted([1, 2, 2, 5], [2, 3, 5], unique=True)) == [1, 2, 3, 5]
+    assert list(merge_sorted([3, 3, 1], [2, 1], reverse=True, unique=True)) == [3, 2, 1]
+
+
+def test_merge_sorted_is_lazy():
+    def endless(start):
+        value = start
+        while True:
+            yield value
+            value += 2
+
+    merged = merge_sorted(endless(0), endless(1))
+    assert [next(merged) for _ in range(6)] == [0, 1, 2, 3, 4, 5]